@@ -18,6 +18,7 @@ class DatabaseConnection:
     def __init__(self, db_path: str = "data/pipeline.db"):
         self.db_path = db_path
         self._local = threading.local()
+        self._prepared_statements = {}
         self._ensure_db_directory()
         self._initialize_database()
     
@@ -132,6 +133,18 @@ class DatabaseConnection:
             cursor.execute(query, params)
             return cursor.rowcount
     
+    def prepare(self, name: str, query: str):
+        """Register a named query for repeated execution.
+        
+        sqlite3 keeps a per-connection cache of compiled statements keyed by SQL
+        text, so reusing the exact same string skips re-parsing and planning.
+        """
+        self._prepared_statements[name] = query
+    
+    def execute_prepared(self, name: str, params: tuple = ()) -> list:
+        """Execute a query registered with prepare() and return all results."""
+        return self.execute_query(self._prepared_statements[name], params)
+    
     def backup_database(self, backup_path: str):
         """Create a backup of the database."""
         with sqlite3.connect(backup_path) as backup_conn:
@@ -114,8 +114,10 @@ class DatabaseSchema:
         "CREATE INDEX IF NOT EXISTS idx_processing_jobs_dataset_id ON processing_jobs (dataset_id)",
         "CREATE INDEX IF NOT EXISTS idx_processing_jobs_status ON processing_jobs (status)",
         "CREATE INDEX IF NOT EXISTS idx_processing_jobs_start_time ON processing_jobs (start_time)",
+        "CREATE INDEX IF NOT EXISTS idx_processing_jobs_start_time_status ON processing_jobs (start_time DESC, status)",
         "CREATE INDEX IF NOT EXISTS idx_figures_dataset_id ON figures (dataset_id)",
         "CREATE INDEX IF NOT EXISTS idx_figures_processing_job_id ON figures (processing_job_id)",
+        "CREATE INDEX IF NOT EXISTS idx_figures_creation_date ON figures (creation_date DESC)",
         "CREATE INDEX IF NOT EXISTS idx_processed_data_dataset_id ON processed_data (dataset_id)",
         "CREATE INDEX IF NOT EXISTS idx_processed_data_processing_job_id ON processed_data (processing_job_id)",
         "CREATE INDEX IF NOT EXISTS idx_processed_data_data_type ON processed_data (data_type)",
@@ -144,8 +144,8 @@ class DatasetOperations:
         return db.execute_update(query, (dataset_id,)) > 0
     
     @staticmethod
-    def search_datasets(search_term: str) -> List[Dataset]:
-        """Search datasets by name or description."""
+    def search_datasets(search_term: str, limit: int = None) -> List[Dataset]:
+        """Search datasets by name or description, optionally capping the result count."""
         db = get_database()
         query = """
             SELECT * FROM datasets 
@@ -153,7 +153,13 @@ class DatasetOperations:
             ORDER BY import_date DESC
         """
         search_pattern = f"%{search_term}%"
-        results = db.execute_query(query, (search_pattern, search_pattern))
+        params = (search_pattern, search_pattern)
+        
+        if limit:
+            query += " LIMIT ?"
+            params += (limit,)
+        
+        results = db.execute_query(query, params)
         
         datasets = []
         for result in results:
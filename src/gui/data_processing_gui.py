@@ -8,17 +8,35 @@ import sys
 import os
 import threading
 import time
+import asyncio
+import functools
+from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from src.database.connection import get_database
 from src.database.operations import DatasetOperations, ProcessingJobOperations
+from src.data_processing.processors import DataProcessingManager
 
 
 class DataProcessingGUI:
     """GUI for data processing functionality."""
     
+    # Window over which bursts of progress ticks are merged into one GUI push
+    PROGRESS_COALESCE_SECONDS = 0.1
+    # Processor ticks closer together than this (in seconds and percent) are dropped
+    PROGRESS_MIN_INTERVAL = 0.25
+    PROGRESS_MIN_DELTA = 1.0
+    # Seconds a cached dataset name stays valid for the jobs tree
+    DATASET_NAME_TTL = 60.0
+    # Fixed row height (pixels) of the virtualized preview grid
+    PREVIEW_ROW_HEIGHT = 20
+    # Seconds between background reloads of the jobs snapshot
+    JOBS_POLL_INTERVAL = 5.0
+    
     def __init__(self):
         self.window = tk.Toplevel()
         self.window.title("Data Processing")
@@ -26,9 +44,35 @@ class DataProcessingGUI:
         self.window.configure(bg='#f0f0f0')
         
         self.selected_dataset = None
+        self._db = get_database()
+        # Jobs tree rows keyed by job ID, so refreshes only touch changed rows
+        self._job_row_map = {}
+        self._job_row_values = {}
+        # Dataset names for the jobs tree: {dataset_id: (fetched_at, name)}
+        self._dataset_name_cache = {}
+        # Latest jobs listing; only the snapshot worker reloads it from the database
+        self._jobs_snapshot = []
+        self._jobs_snapshot_event = None
+        # Background asyncio loop that runs processing jobs and the jobs snapshot worker
+        self._processing_loop = None
+        self._jobs_snapshot_future = None
+        self._prepare_job_queries()
         self.setup_ui()
+        # Stop the background loop with the window, whichever way it is closed
+        self.window.bind("<Destroy>", self._on_window_destroy)
         self.load_datasets()
     
+    def _prepare_job_queries(self):
+        """Register the queries used on the job refresh path."""
+        # Only the columns shown in the tree; the tree can't usefully show more than 500 rows
+        self._db.prepare('active_jobs', """
+            SELECT id, dataset_id, job_name, job_type, status, progress
+            FROM processing_jobs 
+            WHERE start_time > ? OR status IN ('running', 'pending')
+            ORDER BY start_time DESC
+            LIMIT 500
+        """)
+    
     def setup_ui(self):
         """Set up the user interface."""
         # Title
@@ -72,7 +116,6 @@ class DataProcessingGUI:
         self.processing_type_var = tk.StringVar()
         
         # Get available processors dynamically
-        from src.data_processing.processors import DataProcessingManager
         manager = DataProcessingManager()
         available_processors = manager.get_available_processors()
         
@@ -136,16 +179,15 @@ class DataProcessingGUI:
         ttk.Button(action_frame, text="Start Processing", 
                   command=self.start_processing).pack(side="left", padx=5)
         ttk.Button(action_frame, text="Refresh Jobs", 
-                  command=self.refresh_jobs).pack(side="left", padx=5)
+                  command=self._request_jobs_snapshot).pack(side="left", padx=5)
         ttk.Button(action_frame, text="Cancel Selected Job", 
                   command=self.cancel_job).pack(side="left", padx=5)
-        ttk.Button(action_frame, text="Remove Finished Job", 
+        ttk.Button(action_frame, text="Remove Finished Jobs", 
                   command=self.remove_finished_job).pack(side="left", padx=5)
         ttk.Button(action_frame, text="Close", 
                   command=self.window.destroy).pack(side="right", padx=5)
         
-        # Start job refresh timer
-        self.refresh_jobs()
+        # Start job refresh worker
         self.schedule_job_refresh()
     
     def create_matrix_extraction_params(self):
@@ -230,7 +272,6 @@ class DataProcessingGUI:
             return
         
         # Get available matrices for the selected dataset
-        from src.data_processing.processors import DataProcessingManager
         manager = DataProcessingManager()
         matrix_processor = manager.get_processor("Matrix Modification")
         
@@ -261,7 +302,6 @@ class DataProcessingGUI:
         
         if matrix_name and operation:
             # Generate suggested filename
-            from src.data_processing.processors import DataProcessingManager
             manager = DataProcessingManager()
             matrix_processor = manager.get_processor("Matrix Modification")
             
@@ -417,7 +457,6 @@ class DataProcessingGUI:
             return
         
         # Get available matrix dimensions for the selected dataset
-        from src.data_processing.processors import DataProcessingManager
         manager = DataProcessingManager()
         annotation_processor = manager.get_processor("Data Annotation")
         
@@ -534,7 +573,6 @@ class DataProcessingGUI:
             return
         
         # Get available matrices for the selected dataset
-        from src.data_processing.processors import DataProcessingManager
         manager = DataProcessingManager()
         ruzicka_processor = manager.get_processor("Ruzicka Similarity")
         
@@ -625,7 +663,6 @@ class DataProcessingGUI:
             return
         
         # Get available matrices for the selected dataset
-        from src.data_processing.processors import DataProcessingManager
         manager = DataProcessingManager()
         hierarchical_processor = manager.get_processor("Hierarchical Clustering")
         
@@ -1012,11 +1049,14 @@ class DataProcessingGUI:
             # Start processing in background thread
             ProcessingJobOperations.update_job_status(job_id, "running", progress=0.0)
             
-            # Start real processing with a background thread
-            threading.Thread(target=self.real_processing, args=(job_id, processing_type, parameters), daemon=True).start()
+            # Start real processing on the background processing loop
+            asyncio.run_coroutine_threadsafe(
+                self._real_processing_async(job_id, processing_type, parameters),
+                self._get_processing_loop()
+            )
             
             messagebox.showinfo("Success", f"Processing job '{job_name}' started successfully!")
-            self.refresh_jobs()
+            self._request_jobs_snapshot()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start processing: {str(e)}")
@@ -1100,7 +1140,6 @@ class DataProcessingGUI:
             parameters['dataset_name'] = self.selected_dataset.name
             
             # Get Ruzicka Similarity processor and generate preview
-            from src.data_processing.processors import DataProcessingManager
             manager = DataProcessingManager()
             ruzicka_processor = manager.get_processor("Ruzicka Similarity")
             
@@ -1169,15 +1208,23 @@ class DataProcessingGUI:
             # Create sorted values based on indices
             sorted_values = vector_numeric.iloc[indices.argsort()]
             
-            # Prepare preview data
-            preview_data = pd.DataFrame({
-                'Original_Values': vector_numeric,
-                'Indices': indices,
-                'Sorted_Values': sorted_values.values
-            })
+            # Keep the preview as plain column arrays; slices are cheap views
+            orig_arr = vector_numeric.to_numpy()
+            idx_arr = indices.to_numpy()
+            srt_arr = sorted_values.to_numpy()
+            
+            def preview_provider(start, count):
+                end = start + count
+                return orig_arr[start:end], idx_arr[start:end], srt_arr[start:end]
+            
+            # srt_arr is already sorted, so distinct values are where neighbours differ
+            unique_values = int(np.count_nonzero(np.diff(srt_arr))) + 1 if srt_arr.size else 0
             
             # Show the indexing preview window
-            self.show_indexing_preview_window(preview_data, column_name, vector_column)
+            self.show_indexing_preview_window(
+                preview_provider, orig_arr.size, unique_values,
+                column_name, vector_column
+            )
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate indexing preview: {str(e)}")
@@ -1228,8 +1275,14 @@ class DataProcessingGUI:
         # Close button
         ttk.Button(preview_window, text="Close", command=preview_window.destroy).pack(pady=10)
     
-    def show_indexing_preview_window(self, preview_data, column_name, vector_column):
-        """Show indexing preview in a separate window with three columns."""
+    def show_indexing_preview_window(self, preview_provider, total_values, unique_values,
+                                     column_name, vector_column):
+        """Show indexing preview in a separate window with three columns.
+        
+        The grid is drawn on a Canvas and only the rows inside the viewport are
+        rendered; preview_provider(start, count) returns the (original, indices,
+        sorted) array slices for those rows.
+        """
         preview_window = tk.Toplevel(self.window)
         preview_window.title(f"Indexing Preview - {column_name}")
         preview_window.geometry("900x700")
@@ -1240,8 +1293,8 @@ class DataProcessingGUI:
         
         info_text = f"Vector Column: {vector_column}\n"
         info_text += f"Index Column Name: {column_name}\n"
-        info_text += f"Total Values: {len(preview_data)}\n"
-        info_text += f"Unique Values: {preview_data['Original_Values'].nunique()}"
+        info_text += f"Total Values: {total_values}\n"
+        info_text += f"Unique Values: {unique_values}"
         
         ttk.Label(info_frame, text=info_text, font=("Arial", 10)).pack(anchor="w")
         
@@ -1249,42 +1302,104 @@ class DataProcessingGUI:
         preview_frame = ttk.Frame(preview_window)
         preview_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
-        # Create Treeview for tabular display
-        tree_frame = ttk.Frame(preview_frame)
-        tree_frame.pack(fill="both", expand=True)
+        # Virtualized grid: a fixed row height keeps row <-> pixel mapping O(1)
+        grid_frame = ttk.Frame(preview_frame)
+        grid_frame.pack(fill="both", expand=True)
         
-        # Treeview with three columns
-        columns = ('original', 'indices', 'sorted')
-        tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=25)
+        row_height = self.PREVIEW_ROW_HEIGHT
+        column_specs = (('Original Values', 200), ('Indices', 100), ('Sorted Values', 200))
+        column_centers = []
+        grid_width = 0
+        for _, width in column_specs:
+            column_centers.append(grid_width + width / 2)
+            grid_width += width
         
-        # Define column headings
-        tree.heading('original', text='Original Values')
-        tree.heading('indices', text='Indices')
-        tree.heading('sorted', text='Sorted Values')
+        canvas = tk.Canvas(grid_frame, bg="white", highlightthickness=0)
+        v_scrollbar = ttk.Scrollbar(grid_frame, orient="vertical")
+        # Columns scroll natively; rows are virtualized through v_scrollbar
+        h_scrollbar = ttk.Scrollbar(grid_frame, orient="horizontal", command=canvas.xview)
+        canvas.configure(xscrollcommand=h_scrollbar.set)
         
-        # Configure column widths
-        tree.column('original', width=200, anchor='center')
-        tree.column('indices', width=100, anchor='center')
-        tree.column('sorted', width=200, anchor='center')
-        
-        # Add scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
-        h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=tree.xview)
-        
-        tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
-        
-        # Pack scrollbars and tree
         v_scrollbar.pack(side="right", fill="y")
         h_scrollbar.pack(side="bottom", fill="x")
-        tree.pack(side="left", fill="both", expand=True)
+        canvas.pack(side="left", fill="both", expand=True)
+        
+        first_row = 0
+        rendered_range = None
+        pending_configure = None
         
-        # Insert data into the tree
-        for i in range(len(preview_data)):
-            original_val = f"{preview_data.iloc[i]['Original_Values']:.6f}"
-            index_val = str(preview_data.iloc[i]['Indices'])
-            sorted_val = f"{preview_data.iloc[i]['Sorted_Values']:.6f}"
+        def visible_row_count():
+            # One row of the viewport is taken by the header
+            return max(1, canvas.winfo_height() // row_height - 1)
+        
+        def render():
+            nonlocal rendered_range
+            canvas.delete("all")
+            for (heading, _), x in zip(column_specs, column_centers):
+                canvas.create_text(x, row_height / 2, text=heading, font=("Arial", 9, "bold"))
+            canvas.create_line(0, row_height, grid_width, row_height, fill="#c0c0c0")
+            
+            count = visible_row_count()
+            rendered_range = (first_row, count)
+            canvas.configure(scrollregion=(0, 0, grid_width, (count + 1) * row_height))
+            last_row = min(total_values, first_row + count)
+            originals, indices, sorted_values = preview_provider(first_row, count)
+            for offset, (original_val, index_val, sorted_val) in enumerate(
+                    zip(originals, indices, sorted_values)):
+                y = (offset + 1.5) * row_height
+                texts = (f"{original_val:.6f}", str(index_val), f"{sorted_val:.6f}")
+                for text, x in zip(texts, column_centers):
+                    canvas.create_text(x, y, text=text, font=("Courier", 9))
             
-            tree.insert('', 'end', values=(original_val, index_val, sorted_val))
+            if total_values:
+                v_scrollbar.set(first_row / total_values, last_row / total_values)
+            else:
+                v_scrollbar.set(0.0, 1.0)
+        
+        def render_if_range_changed():
+            # Only redraw when the visible row range actually moved or resized
+            if (first_row, visible_row_count()) != rendered_range:
+                render()
+        
+        def scroll_to(row):
+            nonlocal first_row
+            max_first_row = max(0, total_values - visible_row_count())
+            first_row = max(0, min(int(row), max_first_row))
+            render_if_range_changed()
+        
+        def on_configure(event):
+            # Coalesce bursts of resize events into a single check
+            nonlocal pending_configure
+            if pending_configure is not None:
+                canvas.after_cancel(pending_configure)
+            pending_configure = canvas.after(50, on_configure_idle)
+        
+        def on_configure_idle():
+            nonlocal pending_configure
+            pending_configure = None
+            render_if_range_changed()
+        
+        def on_scrollbar(action, amount, unit=None):
+            if action == "moveto":
+                scroll_to(float(amount) * total_values)
+            elif action == "scroll":
+                step = visible_row_count() if unit == "pages" else 1
+                scroll_to(first_row + int(amount) * step)
+        
+        def wheel_steps(event):
+            # Windows sends multiples of 120; macOS and trackpads send smaller deltas
+            if abs(event.delta) >= 120:
+                steps = int(event.delta / 120)
+            else:
+                steps = (event.delta > 0) - (event.delta < 0)
+            return steps
+        
+        v_scrollbar.config(command=on_scrollbar)
+        canvas.bind("<Configure>", on_configure)
+        canvas.bind("<MouseWheel>", lambda event: scroll_to(first_row - 3 * wheel_steps(event)))
+        canvas.bind("<Shift-MouseWheel>", lambda event: canvas.xview_scroll(-wheel_steps(event), "units"))
+        canvas.bind("<Button-4>", lambda event: scroll_to(first_row - 3))
+        canvas.bind("<Button-5>", lambda event: scroll_to(first_row + 3))
         
         # Button frame
         button_frame = ttk.Frame(preview_window)
@@ -1292,104 +1407,225 @@ class DataProcessingGUI:
         
         ttk.Button(button_frame, text="Close", command=preview_window.destroy).pack(side="right", padx=5)
     
-    def real_processing(self, job_id, processing_type, parameters):
-        """Perform actual matrix extraction processing."""
+    def _get_processing_loop(self):
+        """Get the asyncio loop that runs jobs and the jobs snapshot, starting it on first use."""
+        if self._processing_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=self._run_processing_loop, args=(loop,), daemon=True).start()
+            # Created on the loop's thread so it binds to that loop on every Python version
+            self._jobs_snapshot_event = asyncio.run_coroutine_threadsafe(
+                self._create_event(), loop).result()
+            self._processing_loop = loop
+        return self._processing_loop
+    
+    @staticmethod
+    def _run_processing_loop(loop):
+        """Run the processing loop until it is stopped, then release it (loop thread)."""
+        asyncio.set_event_loop(loop)
         try:
-            def progress_callback(progress):
-                ProcessingJobOperations.update_job_status(job_id, "running", progress=progress)
-                self.window.after(0, self.refresh_jobs)
-            
-            # Import the processing manager
-            from src.data_processing.processors import DataProcessingManager
-            
-            # Create processing manager
-            manager = DataProcessingManager()
-            
-            # Get the job details to find the dataset
-            from src.database.connection import get_database
-            db = get_database()
-            job_query = "SELECT dataset_id, job_name FROM processing_jobs WHERE id = ?"
-            job_result = db.execute_query(job_query, (job_id,))
-            
-            if not job_result:
-                raise Exception(f"Job {job_id} not found in database")
-            
-            dataset_id, job_name = job_result[0]
-            
-            # Process the dataset
-            result = manager.process_dataset(
-                dataset_id=dataset_id,
-                processor_name=processing_type,
-                job_name=job_name,
-                parameters=parameters,
-                progress_callback=progress_callback
+            loop.run_forever()
+        finally:
+            loop.close()
+    
+    @staticmethod
+    async def _create_event():
+        """Create an asyncio.Event on the running loop."""
+        return asyncio.Event()
+    
+    def _on_window_destroy(self, event):
+        """Shut the processing loop down once the window itself is destroyed."""
+        if event.widget is not self.window or self._processing_loop is None:
+            return
+        
+        if self._jobs_snapshot_future is not None:
+            self._jobs_snapshot_future.cancel()
+        asyncio.run_coroutine_threadsafe(self._stop_processing_loop(), self._processing_loop)
+    
+    async def _stop_processing_loop(self):
+        """Let running jobs record their final status, then stop the loop."""
+        current = asyncio.current_task()
+        await asyncio.gather(*(task for task in asyncio.all_tasks() if task is not current),
+                             return_exceptions=True)
+        asyncio.get_running_loop().stop()
+    
+    async def _real_processing_async(self, job_id, processing_type, parameters):
+        """Run a processing job in the executor and record its final status."""
+        loop = asyncio.get_running_loop()
+        progress_queue = asyncio.Queue()
+        consumer = loop.create_task(self._consume_progress(job_id, progress_queue))
+        
+        def progress_callback(progress):
+            loop.call_soon_threadsafe(progress_queue.put_nowait, progress)
+        
+        try:
+            result = await loop.run_in_executor(
+                None, self.real_processing, job_id, processing_type, parameters, progress_callback
             )
+        except Exception as e:
+            result = {'success': False, 'message': str(e)}
+        finally:
+            # Flush pending progress before the final status is written
+            progress_queue.put_nowait(None)
+            await consumer
+        
+        # Status writes can wait on the database lock, so they run in the executor, not on the loop
+        if result['success']:
+            # Complete the job with actual output path
+            output_path = result.get('output_path', 'No output file')
+            await loop.run_in_executor(None, functools.partial(
+                ProcessingJobOperations.update_job_status,
+                job_id, "completed", progress=100.0, output_path=output_path
+            ))
+        else:
+            # Job failed
+            await loop.run_in_executor(None, functools.partial(
+                ProcessingJobOperations.update_job_status,
+                job_id, "failed", error_message=result.get('message', 'Unknown error')
+            ))
+        
+        # Final GUI update
+        self._jobs_snapshot_event.set()
+    
+    async def _consume_progress(self, job_id, progress_queue):
+        """Coalesce bursts of progress ticks into a single DB write and GUI refresh."""
+        finished = False
+        while not finished:
+            progress = await progress_queue.get()
+            if progress is None:
+                return
             
-            if result['success']:
-                # Complete the job with actual output path
-                output_path = result.get('output_path', 'No output file')
-                ProcessingJobOperations.update_job_status(
-                    job_id, "completed", progress=100.0, 
-                    output_path=output_path
-                )
-            else:
-                # Job failed
-                ProcessingJobOperations.update_job_status(
-                    job_id, "failed", error_message=result.get('message', 'Unknown error')
-                )
+            # Let the burst accumulate, then keep only the latest value
+            await asyncio.sleep(self.PROGRESS_COALESCE_SECONDS)
+            while not progress_queue.empty():
+                latest = progress_queue.get_nowait()
+                if latest is None:
+                    finished = True
+                    break
+                progress = latest
             
-            # Final GUI update
-            self.window.after(0, self.refresh_jobs)
+            await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+                ProcessingJobOperations.update_job_status, job_id, "running", progress=progress
+            ))
+            self._jobs_snapshot_event.set()
+    
+    def real_processing(self, job_id, processing_type, parameters, progress_callback):
+        """Perform actual matrix extraction processing and return the processor result."""
+        # Create processing manager
+        manager = DataProcessingManager()
+        
+        # Get the job details to find the dataset
+        job_query = "SELECT dataset_id, job_name FROM processing_jobs WHERE id = ?"
+        job_result = self._db.execute_query(job_query, (job_id,))
+        
+        if not job_result:
+            raise Exception(f"Job {job_id} not found in database")
+        
+        dataset_id, job_name = job_result[0]
+        
+        # Throttle processor ticks; the final 100% tick is always passed through
+        last_ts = 0.0
+        last_pct = -1.0
+        
+        def throttled_progress(progress):
+            nonlocal last_ts, last_pct
+            now = time.monotonic()
+            if (progress < 100.0 and now - last_ts < self.PROGRESS_MIN_INTERVAL
+                    and abs(progress - last_pct) < self.PROGRESS_MIN_DELTA):
+                return
+            last_ts, last_pct = now, progress
+            progress_callback(progress)
+        
+        # Process the dataset
+        return manager.process_dataset(
+            dataset_id=dataset_id,
+            processor_name=processing_type,
+            job_name=job_name,
+            parameters=parameters,
+            progress_callback=throttled_progress
+        )
+    
+    async def _jobs_snapshot_worker(self):
+        """Reload the jobs snapshot periodically or when requested, then re-render."""
+        while True:
+            self._jobs_snapshot_event.clear()
+            try:
+                # The query and its pandas post-processing run in the executor, off the loop
+                self._jobs_snapshot = await asyncio.get_running_loop().run_in_executor(
+                    None, self._load_jobs_snapshot)
+                self.window.after(0, self.refresh_jobs)
+            except tk.TclError:
+                # Window has been closed
+                return
+            except Exception as e:
+                print(f"Error refreshing jobs: {e}")
             
-        except Exception as e:
-            ProcessingJobOperations.update_job_status(
-                job_id, "failed", error_message=str(e)
-            )
-            self.window.after(0, self.refresh_jobs)
+            try:
+                await asyncio.wait_for(self._jobs_snapshot_event.wait(), self.JOBS_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+    
+    def _request_jobs_snapshot(self):
+        """Ask the snapshot worker to reload the jobs list now (thread-safe)."""
+        loop = self._get_processing_loop()
+        loop.call_soon_threadsafe(self._jobs_snapshot_event.set)
+    
+    def _load_jobs_snapshot(self):
+        """Query recent and active jobs from the database."""
+        # Add completed jobs from today
+        today = datetime.now() - timedelta(days=1)
+        results = self._db.execute_prepared('active_jobs', (today.isoformat(),))
+        if not results:
+            return []
+        
+        # Build the display columns in one vectorized pass instead of per row
+        jobs = pd.DataFrame(results, columns=['id', 'dataset_id', 'job_name', 'job_type', 'status', 'progress'])
+        dataset_names = {dataset_id: self._get_dataset_name(dataset_id)
+                         for dataset_id in jobs['dataset_id'].unique().tolist()}
+        jobs['dataset_name'] = jobs['dataset_id'].map(dataset_names)
+        jobs['progress'] = jobs['progress'].fillna(0.0)
+        jobs['progress_text'] = jobs['progress'].round(1).astype(str) + '%'
+        
+        return jobs.drop(columns='dataset_id').to_dict('records')
     
     def refresh_jobs(self):
-        """Refresh the active jobs list."""
+        """Render the active jobs list from the current jobs snapshot."""
         try:
-            # Clear existing items
-            for item in self.jobs_tree.get_children():
-                self.jobs_tree.delete(item)
-            
-            # Get active jobs
-            active_jobs = ProcessingJobOperations.get_active_jobs()
-            
-            # Add completed jobs from today
-            from datetime import datetime, timedelta
-            today = datetime.now() - timedelta(days=1)
+            new_rows = {
+                job['id']: (job['job_name'], (job['dataset_name'], job['job_type'], job['status'], job['progress_text']))
+                for job in self._jobs_snapshot
+            }
             
-            all_jobs_query = """
-                SELECT * FROM processing_jobs 
-                WHERE start_time > ? OR status IN ('running', 'pending')
-                ORDER BY start_time DESC
-            """
+            # Remove rows for jobs that are no longer listed
+            for job_id in set(self._job_row_map) - set(new_rows):
+                self.jobs_tree.delete(self._job_row_map.pop(job_id))
+                self._job_row_values.pop(job_id, None)
             
-            from src.database.connection import get_database
-            db = get_database()
-            results = db.execute_query(all_jobs_query, (today.isoformat(),))
-            
-            for result in results:
-                job_id = result[0]
-                dataset_id = result[1]
-                job_name = result[2]
-                job_type = result[3]
-                status = result[7]
-                progress = result[10] or 0.0
-                
-                # Get dataset name
-                dataset = DatasetOperations.get_dataset(dataset_id)
-                dataset_name = dataset.name if dataset else f"Dataset {dataset_id}"
-                
-                # Insert into tree
-                self.jobs_tree.insert("", "end", text=job_name, 
-                                     values=(dataset_name, job_type, status, f"{progress:.1f}%"))
+            # Update changed rows in place and insert new ones in query order
+            for index, (job_id, row) in enumerate(new_rows.items()):
+                job_name, values = row
+                iid = self._job_row_map.get(job_id)
+                if iid is None:
+                    self._job_row_map[job_id] = self.jobs_tree.insert(
+                        "", index, text=job_name, values=values)
+                elif self._job_row_values.get(job_id) != row:
+                    self.jobs_tree.item(iid, text=job_name, values=values)
+                self._job_row_values[job_id] = row
                 
         except Exception as e:
             print(f"Error refreshing jobs: {e}")
     
+    def _get_dataset_name(self, dataset_id):
+        """Get a dataset's display name, cached for DATASET_NAME_TTL seconds."""
+        now = time.monotonic()
+        cached = self._dataset_name_cache.get(dataset_id)
+        if cached and now - cached[0] < self.DATASET_NAME_TTL:
+            return cached[1]
+        
+        dataset = DatasetOperations.get_dataset(dataset_id)
+        dataset_name = dataset.name if dataset else f"Dataset {dataset_id}"
+        self._dataset_name_cache[dataset_id] = (now, dataset_name)
+        return dataset_name
+    
     def cancel_job(self):
         """Cancel selected job."""
         selection = self.jobs_tree.selection()
@@ -1401,65 +1637,72 @@ class DataProcessingGUI:
         messagebox.showinfo("Coming Soon", "Job cancellation will be implemented soon!")
     
     def remove_finished_job(self):
-        """Remove selected finished or failed job."""
+        """Remove selected finished or failed jobs."""
         selection = self.jobs_tree.selection()
         if not selection:
             messagebox.showwarning("No Selection", "Please select a job to remove.")
             return
         
         try:
-            # Get selected job info
-            item = self.jobs_tree.item(selection[0])
-            job_name = item['text']
-            job_status = item['values'][2]  # Status column
+            # Get selected jobs info from the snapshot
+            job_ids_by_row = {iid: job_id for job_id, iid in self._job_row_map.items()}
+            selected_ids = {job_ids_by_row.get(iid) for iid in selection}
+            jobs = [job for job in self._jobs_snapshot if job['id'] in selected_ids]
+            if not jobs:
+                messagebox.showerror("Error", "Could not find job in database.")
+                return
             
             # Only allow removal of completed or failed jobs
-            if job_status not in ['completed', 'failed']:
-                messagebox.showwarning("Cannot Remove", 
-                                     f"Cannot remove job with status '{job_status}'. "
-                                     "Only completed or failed jobs can be removed.")
-                return
+            for job in jobs:
+                if job['status'] not in ['completed', 'failed']:
+                    messagebox.showwarning("Cannot Remove", 
+                                         f"Cannot remove job '{job['job_name']}' with status '{job['status']}'. "
+                                         "Only completed or failed jobs can be removed.")
+                    return
+            
+            if len(jobs) == 1:
+                description = f"the job '{jobs[0]['job_name']}'"
+            else:
+                description = f"the {len(jobs)} selected jobs"
             
             # Confirm removal
             confirm = messagebox.askyesno("Confirm Removal", 
-                                        f"Are you sure you want to remove the job '{job_name}'?\n"
+                                        f"Are you sure you want to remove {description}?\n"
                                         "This action cannot be undone.")
             
             if confirm:
-                # Find the job ID from the database
-                from src.database.connection import get_database
-                db = get_database()
-                
-                # Get job ID by name and status
-                job_query = """
-                    SELECT id FROM processing_jobs 
-                    WHERE job_name = ? AND status = ?
-                    ORDER BY start_time DESC LIMIT 1
-                """
-                job_result = db.execute_query(job_query, (job_name, job_status))
-                
-                if job_result:
-                    job_id = job_result[0][0]
-                    
-                    # Delete the job from database
-                    delete_query = "DELETE FROM processing_jobs WHERE id = ?"
-                    db.execute_query(delete_query, (job_id,))
-                    
-                    # Refresh the jobs list
-                    self.refresh_jobs()
-                    
-                    messagebox.showinfo("Success", f"Job '{job_name}' has been removed.")
-                else:
-                    messagebox.showerror("Error", "Could not find job in database.")
+                # Drop the jobs from the snapshot right away; the DELETE runs on the processing loop
+                job_ids = [job['id'] for job in jobs]
+                self._jobs_snapshot = [job for job in self._jobs_snapshot if job['id'] not in selected_ids]
+                self.refresh_jobs()
+                asyncio.run_coroutine_threadsafe(self._delete_jobs_async(job_ids, description),
+                                                 self._get_processing_loop())
                     
         except Exception as e:
             messagebox.showerror("Error", f"Failed to remove job: {str(e)}")
     
+    async def _delete_jobs_async(self, job_ids, description):
+        """Delete jobs from the database in one statement, report the outcome and reload the jobs snapshot."""
+        placeholders = ", ".join("?" for _ in job_ids)
+        try:
+            # execute_update runs in a single transaction, so this is one commit per batch;
+            # it runs in the executor so waiting on the database lock doesn't stall the loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._db.execute_update,
+                f"DELETE FROM processing_jobs WHERE id IN ({placeholders})", tuple(job_ids))
+        except Exception as e:
+            print(f"Error removing jobs {job_ids}: {e}")
+            self.window.after(0, messagebox.showerror, "Error", f"Failed to remove job: {str(e)}")
+        else:
+            self.window.after(0, messagebox.showinfo, "Success", f"Removed {description}.")
+        
+        # Reloading restores any optimistically removed rows whose DELETE failed
+        self._jobs_snapshot_event.set()
+    
     def schedule_job_refresh(self):
-        """Schedule periodic job refresh."""
-        self.refresh_jobs()
-        self.window.after(5000, self.schedule_job_refresh)  # Refresh every 5 seconds
-
+        """Start the background worker that keeps the jobs snapshot up to date."""
+        self._jobs_snapshot_future = asyncio.run_coroutine_threadsafe(
+            self._jobs_snapshot_worker(), self._get_processing_loop())
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -6,6 +6,19 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import sys
 import os
+import importlib.util
+import re
+import fnmatch
+import platform
+import subprocess
+import time
+import queue
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from bisect import bisect_left
+from types import MappingProxyType
 import numpy as np
 import pandas as pd
 from datetime import datetime
@@ -14,25 +27,110 @@ from typing import Dict, List, Optional, Any
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from src.database.connection import get_database
 from src.database.operations import DatasetOperations, FigureOperations, ProcessingJobOperations
 
-# Import matplotlib for figure display
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.figure import Figure
-    import seaborn as sns
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
+# Matplotlib is imported on first use of the Figure Inspection tab (see _import_matplotlib)
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec("matplotlib") is not None
+Figure = None
+FigureCanvasTkAgg = None
+
+
+def _import_matplotlib():
+    """Import the matplotlib classes used for figure display."""
+    global Figure, FigureCanvasTkAgg
+    if Figure is None:
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+
+# pyarrow is optional; when installed it parses label CSVs faster than the default C engine
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+CSV_ENGINE = "pyarrow" if PYARROW_AVAILABLE else "c"
+
+
+def _max_downsample(matrix, max_rows, max_cols):
+    """Reduce a 2D matrix to at most max_rows x max_cols by taking the max of each block.
+    
+    Max (rather than striding or averaging) keeps isolated events in sparse
+    binary rasters visible after reduction.
+    """
+    row_step = -(-matrix.shape[0] // max(1, max_rows))
+    col_step = -(-matrix.shape[1] // max(1, max_cols))
+    if row_step > 1:
+        matrix = np.maximum.reduceat(matrix, np.arange(0, matrix.shape[0], row_step), axis=0)
+    if col_step > 1:
+        matrix = np.maximum.reduceat(matrix, np.arange(0, matrix.shape[1], col_step), axis=1)
+    return matrix
+
+
+def _compact_binary(matrix):
+    """Return a 0/1 matrix as uint8 (one byte per cell); other matrices are returned unchanged."""
+    if matrix.dtype == np.uint8 or matrix.dtype == np.bool_ or matrix.ndim != 2:
+        return matrix
+    # Cheap rejection on the first row before scanning the whole matrix
+    if matrix.size == 0 or not np.isin(matrix[0], (0, 1)).all():
+        return matrix
+    if not ((matrix == 0) | (matrix == 1)).all():
+        return matrix
+    return matrix.astype(np.uint8)
+
+
+def _npz_array_sizes(file_path):
+    """Return {name: element count} for the arrays in an .npz, reading only their headers."""
+    sizes = {}
+    with zipfile.ZipFile(file_path) as archive:
+        for member in archive.namelist():
+            if not member.endswith('.npy'):
+                continue
+            with archive.open(member) as f:
+                version = np.lib.format.read_magic(f)
+                if version == (1, 0):
+                    shape = np.lib.format.read_array_header_1_0(f)[0]
+                else:
+                    shape = np.lib.format.read_array_header_2_0(f)[0]
+            sizes[member[:-4]] = int(np.prod(shape))
+    return sizes
+
+
+@lru_cache(maxsize=3)
+def _load_matrix_file(path, mtime, compact=False):
+    """Memory-map a .npy matrix; mtime is part of the cache key so edited files are re-read."""
+    matrix = np.load(path, mmap_mode='r')
+    return _compact_binary(matrix) if compact else matrix
+
+
+def _load_matrix(path, compact=False):
+    """Load a .npy matrix through the small cache of recently used files.
+    
+    Arrays are shared between callers and must not be modified in place.
+    """
+    return _load_matrix_file(path, os.path.getmtime(path), compact)
+
+
+@lru_cache(maxsize=16)
+def _binary_lut(cmap_name):
+    """RGBA colors (uint8) for the values 0 and 1 of a binary raster under the given colormap."""
+    from matplotlib import colormaps
+    return (colormaps[cmap_name]([0.0, 1.0]) * 255).round().astype(np.uint8)
+
+
+# Dataset id at the end of an inspection dropdown entry such as "name (ID: 3)"
+_DATASET_ID_RE = re.compile(r"\(ID: (\d+)\)$")
+
+
+@lru_cache(maxsize=64)
+def _glob_regex(pattern: str):
+    """Compile a glob pattern once; returns the regex's match method."""
+    return re.compile(fnmatch.translate(pattern)).match
 
 
 class FigureGenerationGUI:
     """GUI for figure generation functionality."""
     
     # Mode definitions - will be populated with custom modes
-    # This dictionary will store mode configurations as they are added
-    MODE_DEFINITIONS = {
+    # This read-only mapping stores mode configurations; add new modes here
+    MODE_DEFINITIONS = MappingProxyType({
         "RasterPlot": {
             "description": "Visualize raster matrix data with customizable labels and colormaps",
             "file_types": [".npy", ".csv"],
@@ -77,7 +175,40 @@ class FigureGenerationGUI:
                 "framerate_default": 10.02
             }
         }
-    }
+    })
+    
+    # Extensions of the dataset files listed for the Required Files dropdowns
+    DATA_FILE_EXTENSIONS = ('.csv', '.txt', '.xlsx', '.npy', '.npz')
+    # Number of figure records fetched per page in the Browse tab
+    FIGURES_PAGE_SIZE = 100
+    # Rows realized in the browse tree around the scroll position; the rest stay in Python lists
+    FIGURES_WINDOW_ROWS = 100
+    # Seconds the cached dataset list stays valid
+    DATASETS_CACHE_TTL = 5.0
+    # Background loaders hand results to the Tk thread in batches through a queue
+    UI_QUEUE_BATCH_SIZE = 50
+    UI_QUEUE_POLL_MS = 50
+    UI_QUEUE_MAX_ITEMS = 20
+    # Maximum datasets listed while filtering the dataset dropdown by typed text
+    DATASET_FILTER_LIMIT = 50
+    # File dropdowns with more entries than this list only a prefix-filtered slice
+    FILE_COMBO_LIMIT = 200
+    # Milliseconds between checks on a figure being written in the background
+    GENERATE_POLL_MS = 100
+    # Milliseconds a Browse tab status message stays visible
+    STATUS_CLEAR_MS = 2500
+    # Directory generated figure files are written to
+    FIGURES_DIR = "data/figures"
+    # Milliseconds typing in an inspection control must pause before the figure is redrawn
+    INSPECTION_UPDATE_DELAY_MS = 150
+    # Milliseconds a dataset selection must settle before its jobs are queried
+    JOBS_LOAD_DELAY_MS = 150
+    # Number of datasets whose job choices are kept in memory
+    JOBS_CACHE_SIZE = 64
+    # Seconds cached job choices stay valid, so newly completed jobs show up on reselect
+    JOBS_CACHE_TTL = 5.0
+    # Number of parsed label/annotation CSVs kept in memory
+    LABEL_CACHE_SIZE = 32
     
     def __init__(self):
         self.window = tk.Toplevel()
@@ -87,18 +218,141 @@ class FigureGenerationGUI:
         
         # Initialize variables
         self.selected_dataset = None
+        # Inspection datasets by id, filled when the dataset dropdown is loaded
+        self.inspection_dataset_objects = {}
+        # (dataset, folder path) for get_dataset_path
+        self._dataset_path = (None, None)
         self.selected_file = None
         self.current_data = None
         self.figure_canvas = None
         self.mode_controls_frame = None
+        # Required-file configs of the selected inspection mode, keyed by name
+        self._mode_file_by_name = {}
+        # Names of the selected mode's non-optional files, checked by validate_required_files
+        self._required_file_names = ()
+        # Chosen file per required-file widget, kept up to date by record_file_selection
+        self.selected_files = {}
+        # Required-files widget builder per mode; other modes get the generic widgets
+        self._file_widget_builders = {
+            "RasterPlot": self.create_rasterplot_file_widgets,
+            "MatrixVisualization": self.create_matrix_visualization_file_widgets,
+            "TuningCurve": self.create_tuning_curve_file_widgets,
+        }
+        
+        self._db = get_database()
+        
+        self.dataset_objects = {}
+        self._datasets_loaded = False
+        # Completed-job choices per dataset id: {dataset_id: (fetched_at, job_names)}
+        self._jobs_cache = {}
+        self._job_load_after = None
+        
+        # Browse tab paging state
+        self._loaded_figure_count = 0
+        self._all_figures_loaded = True
+        self._figures_loading = False
+        self._figures_generation = 0
+        # Figures are loaded when the Browse tab is shown, and again after it goes stale
+        self._browse_dirty = True
+        # Figure Inspection tab contents are built (and matplotlib imported) on first view
+        self._inspection_tab = None
+        self._inspection_frame = None
+        # Bound to the (? IS NULL OR ...) filter placeholders of the figures query
+        self._figure_filters = (None, None, None)
+        # Loaded figures as parallel lists; a tree item's iid is its index into them
+        self._row_ids = []
+        self._row_paths = []
+        self._row_texts = []
+        self._row_values = []
+        # Index of the first loaded figure realized in the browse tree
+        self._view_start = 0
+        # Index the next fetched figure row is written to
+        self._next_row_index = 0
+        # Pending after() id that clears the Browse tab status message
+        self._status_clear_after = None
+        
+        # Results from background loaders, applied on the Tk thread by _drain_ui_queue
+        self._ui_queue = queue.Queue()
+        self._ui_workers = 0
+        self._ui_drain_scheduled = False
+        
+        # Inspection files are read on worker threads; stale results are dropped by token
+        self._inspection_load_token = 0
+        self._raster_files = {}
+        self._raster_files_request = None
+        self._inspection_update_after = None
+        # Figure background without the raster axis titles, for blitting title edits
+        self._raster_bg = None
+        self._raster_bg_bounds = None
+        self._raster_titles_ax = None
+        # RasterPlot image and annotation axes, reused while the subplot layout is unchanged
+        self._raster_image = None
+        self._raster_annotation_ax = None
+        self._raster_layout = None
+        # What the raster's ticks and layout were last built from; unchanged inputs skip that work
+        self._raster_layout_key = None
+        self._raster_tick_key = None
+        self._raster_label_frames = (None, None)
+        self._raster_relayout = True
+        # (matrix, vmin, vmax) of the loaded raster, so color limits are not rescanned on every redraw
+        self._raster_clim = (None, None, None)
+        # (matrix, rows, cols, reduced matrix) last handed to imshow
+        self._raster_display = (None, None, None, None)
+        # Data files of the selected dataset, relative to its folder; empty until one is loaded
+        self.available_files = ()
+        # Scanned file lists per dataset name, with the mtimes of every scanned folder at scan time
+        self._files_cache = {}
+        # available_files bucketed by extension, and memoized filter_files_by_type results
+        self._file_index_source = None
+        self._files_by_ext = {}
+        self._file_index = {}
+        # Parsed label/annotation CSVs by path, with the file mtime they were read at
+        self._label_cache = {}
+        self._label_lock = threading.Lock()
+        
+        # Figure files and records are written off the Tk thread
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        # Browse queries run on one long-lived thread, so its sqlite connection and statement cache persist
+        self._db_pool = ThreadPoolExecutor(max_workers=1)
+        # FIGURES_DIR is created on the first generation rather than stat'ed on every one
+        self._figures_dir_ready = False
+        
+        # Platform command used to open figure files, resolved once
+        self._opener = self._resolve_opener()
+        
+        # Short-lived cache of DatasetOperations.list_datasets()
+        self._datasets_cache = None
+        self._datasets_cache_ts = 0.0
         
         # Check matplotlib availability
         if not MATPLOTLIB_AVAILABLE:
             messagebox.showwarning("Missing Dependencies", 
                                  "Matplotlib is not available. Figure Inspection functionality will be limited.")
         
+        # Datasets are loaded on demand when the dataset dropdown is first used
+        self._prepare_figure_queries()
         self.setup_ui()
-        self.load_datasets()
+        # Release the worker pools with the window, whichever way it is closed
+        self._closed = False
+        self.window.bind("<Destroy>", self._on_window_destroy)
+    
+    def _prepare_figure_queries(self):
+        """Register the queries used on the figure browse path."""
+        # Get a page of figures, projecting only the displayed columns; SQLite formats
+        # the creation date and unparseable values are shown as stored
+        self._db.prepare('figures_page', """
+            SELECT f.id, f.figure_name, COALESCE(d.name, 'Dataset ' || f.dataset_id),
+                   COALESCE(f.figure_type, 'Unknown'),
+                   COALESCE(strftime('%Y-%m-%d %H:%M', f.creation_date), f.creation_date, ''),
+                   f.figure_path
+            FROM figures f
+            LEFT JOIN datasets d ON f.dataset_id = d.id
+            WHERE (?1 IS NULL OR d.name = ?1)
+              AND (?2 IS NULL OR f.figure_type = ?2)
+              AND (?3 IS NULL OR f.figure_name LIKE ?3)
+            ORDER BY f.creation_date DESC
+            LIMIT ?4 OFFSET ?5
+        """)
     
     def setup_ui(self):
         """Set up the user interface."""
@@ -118,6 +372,9 @@ class FigureGenerationGUI:
         
         # Figure Inspection tab with scrolling
         self.create_inspection_tab(notebook)
+        
+        self.notebook = notebook
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
     
     def create_scrollable_frame(self, parent):
         """Create a scrollable frame with canvas and scrollbar."""
@@ -185,9 +442,11 @@ class FigureGenerationGUI:
         
         self.dataset_combo_var = tk.StringVar()
         self.dataset_combo = ttk.Combobox(dataset_frame, textvariable=self.dataset_combo_var,
-                                         state="readonly", width=40)
+                                         postcommand=self._ensure_datasets_loaded, width=40)
         self.dataset_combo.grid(row=0, column=1, padx=5, pady=2)
         self.dataset_combo.bind('<<ComboboxSelected>>', self.on_dataset_select)
+        self.dataset_combo.bind('<FocusIn>', self._ensure_datasets_loaded)
+        self.dataset_combo.bind('<KeyRelease>', self.on_dataset_filter_key)
         
         # Processing job selection (optional)
         ttk.Label(dataset_frame, text="Processing Job (optional):").grid(row=1, column=0, sticky="w", padx=5)
@@ -239,7 +498,12 @@ class FigureGenerationGUI:
         self.params_container = ttk.Frame(params_frame)
         self.params_container.pack(fill="both", expand=True)
         
-        self.param_widgets = {}
+        # Plot parameters stored as parallel lists: key, Tk variable, whether it is a checkbox
+        self._param_keys = []
+        self._param_vars = []
+        self._param_is_bool = []
+        # Parameter widgets are hidden and reused, not destroyed, when the parameters are rebuilt
+        self._param_widget_pool = {'label': [], 'entry': [], 'check': []}
         self.create_default_plot_params()
         
         # Preview and generation frame
@@ -258,6 +522,7 @@ class FigureGenerationGUI:
         # Create scrollable frame for the tab
         scrollable_frame, container = self.create_scrollable_frame(parent)
         parent.add(container, text="Browse Figures")
+        self._browse_tab = container
         
         # Filter frame
         filter_frame = ttk.LabelFrame(scrollable_frame, text="Filters", padding=10)
@@ -266,9 +531,10 @@ class FigureGenerationGUI:
         # Dataset filter
         ttk.Label(filter_frame, text="Dataset:").grid(row=0, column=0, sticky="w", padx=5)
         self.filter_dataset_var = tk.StringVar()
-        filter_dataset_combo = ttk.Combobox(filter_frame, textvariable=self.filter_dataset_var,
-                                           state="readonly", width=20)
-        filter_dataset_combo.grid(row=0, column=1, padx=5)
+        self.filter_dataset_combo = ttk.Combobox(filter_frame, textvariable=self.filter_dataset_var,
+                                                state="readonly", width=20,
+                                                postcommand=self._load_filter_datasets)
+        self.filter_dataset_combo.grid(row=0, column=1, padx=5)
         
         # Figure type filter
         ttk.Label(filter_frame, text="Type:").grid(row=0, column=2, sticky="w", padx=5)
@@ -287,6 +553,9 @@ class FigureGenerationGUI:
         
         ttk.Button(filter_frame, text="Apply Filters", 
                   command=self.apply_filters).grid(row=0, column=6, padx=5)
+        # Picks up figures written by other windows or processes
+        ttk.Button(filter_frame, text="Refresh", 
+                  command=self.refresh_figures).grid(row=0, column=7, padx=5)
         
         # Figures list frame
         list_frame = ttk.Frame(scrollable_frame)
@@ -312,11 +581,11 @@ class FigureGenerationGUI:
         self.figures_tree.column("created", width=120)
         self.figures_tree.column("path", width=200)
         
-        figures_scrollbar = ttk.Scrollbar(list_frame, orient="vertical")
-        figures_scrollbar.pack(side="right", fill="y")
+        self.figures_scrollbar = ttk.Scrollbar(list_frame, orient="vertical")
+        self.figures_scrollbar.pack(side="right", fill="y")
         
-        self.figures_tree.config(yscrollcommand=figures_scrollbar.set)
-        figures_scrollbar.config(command=self.figures_tree.yview)
+        self.figures_tree.config(yscrollcommand=self.on_figures_scroll)
+        self.figures_scrollbar.config(command=self._virtual_yview)
         
         # Figure actions frame
         fig_actions_frame = ttk.Frame(scrollable_frame)
@@ -331,8 +600,10 @@ class FigureGenerationGUI:
         ttk.Button(fig_actions_frame, text="Export Figure", 
                   command=self.export_figure).pack(side="left", padx=5)
         
-        # Load figures initially
-        self.load_figures()
+        # Transient status for quick actions, so they do not open a modal dialog
+        self.status_var = tk.StringVar()
+        ttk.Label(fig_actions_frame, textvariable=self.status_var,
+                  foreground="gray").pack(side="left", padx=10)
     
     def create_inspection_tab(self, parent):
         """Create the figure inspection tab."""
@@ -347,9 +618,24 @@ class FigureGenerationGUI:
             message_label.pack(expand=True)
             return
         
-        # Create scrollable frame for the tab
+        # Create scrollable frame for the tab; its contents are built when it is first shown
         scrollable_frame, container = self.create_scrollable_frame(parent)
         parent.add(container, text="Figure Inspection")
+        self._inspection_tab = container
+        self._inspection_frame = scrollable_frame
+    
+    def build_inspection_tab(self):
+        """Build the figure inspection tab contents, importing matplotlib on first use."""
+        scrollable_frame = self._inspection_frame
+        self._inspection_frame = None
+        
+        try:
+            _import_matplotlib()
+        except ImportError as e:
+            ttk.Label(scrollable_frame, 
+                     text=f"Matplotlib could not be loaded for Figure Inspection:\n{e}",
+                     font=("Arial", 12), justify="center").pack(expand=True)
+            return
         
         # Data Selection Section (Top)
         self.create_inspection_data_selection(scrollable_frame)
@@ -516,7 +802,7 @@ class FigureGenerationGUI:
         self.inspection_ax.text(0.5, 0.5, 'Select dataset, file, and mode to display figure', 
                               ha='center', va='center', transform=self.inspection_ax.transAxes,
                               fontsize=12, alpha=0.7)
-        self.figure_canvas.draw()
+        self.figure_canvas.draw_idle()
     
     def create_inspection_controls(self, parent):
         """Create the mode-specific controls section."""
@@ -560,22 +846,22 @@ class FigureGenerationGUI:
     def load_inspection_datasets(self):
         """Load datasets for the inspection tab."""
         try:
-            datasets = DatasetOperations.list_datasets()
+            datasets = self._get_datasets()
             dataset_names = [f"{dataset.name} (ID: {dataset.id})" for dataset in datasets]
             
             self.inspection_dataset_combo['values'] = dataset_names
             
-            # Store dataset objects for reference
-            self.inspection_dataset_objects = {f"{dataset.name} (ID: {dataset.id})": dataset 
-                                             for dataset in datasets}
+            # Store dataset objects by id; the id is parsed back out of the selected entry
+            self.inspection_dataset_objects = {dataset.id: dataset for dataset in datasets}
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load datasets: {str(e)}")
     
     def on_inspection_dataset_select(self, event=None):
         """Handle dataset selection in inspection tab."""
-        selected = self.inspection_dataset_var.get()
-        if selected and selected in self.inspection_dataset_objects:
-            self.selected_dataset = self.inspection_dataset_objects[selected]
+        match = _DATASET_ID_RE.search(self.inspection_dataset_var.get())
+        dataset = self.inspection_dataset_objects.get(int(match.group(1))) if match else None
+        if dataset is not None:
+            self.selected_dataset = dataset
             
             # Load files for this dataset (for later use in Required Files section)
             self.load_dataset_files()
@@ -594,40 +880,79 @@ class FigureGenerationGUI:
             if hasattr(self, 'sorting_frame') and self.sorting_frame.winfo_ismapped():
                 self.update_sorting_vectors_from_labels()
     
+    def get_dataset_path(self):
+        """Return the selected dataset's folder, joining the path once per selected dataset."""
+        dataset = self.selected_dataset
+        if self._dataset_path[0] is not dataset:
+            self._dataset_path = (dataset, os.path.join("data", "datasets", dataset.name))
+        return self._dataset_path[1]
+    
     def load_dataset_files(self):
         """Load available files for the selected dataset."""
         if not self.selected_dataset:
             return
         
-        files = []
-        
         try:
-            # Get raw files from filesystem
-            dataset_path = os.path.join("data", "datasets", self.selected_dataset.name)
-            
-            # Raw files
-            raw_path = os.path.join(dataset_path, "raw")
-            if os.path.exists(raw_path):
-                for file in os.listdir(raw_path):
-                    if file.endswith(('.csv', '.txt', '.xlsx', '.npy', '.npz')):
-                        files.append(f"raw/{file}")
-            
-            # Processed files
-            processed_path = os.path.join(dataset_path, "processed")
-            if os.path.exists(processed_path):
-                for root, dirs, filenames in os.walk(processed_path):
-                    for file in filenames:
-                        if file.endswith(('.csv', '.txt', '.xlsx', '.npy', '.npz')):
-                            rel_path = os.path.relpath(os.path.join(root, file), dataset_path)
-                            files.append(rel_path.replace('\\', '/'))  # Normalize path separators
+            dataset_path = self.get_dataset_path()
+            
+            # Re-scan only when a file was added to or removed from one of the scanned folders;
+            # subfolders of processed/ are checked too, as their changes don't touch its mtime
+            cached = self._files_cache.get(self.selected_dataset.name)
+            if cached and all(self._dir_mtime(path) == mtime for path, mtime in cached[0]):
+                self.available_files = cached[1]
+                return
+            
+            dir_mtimes, files = self._scan_dataset_files(dataset_path)
+            self._files_cache[self.selected_dataset.name] = (dir_mtimes, files)
             
             # Store available files for use in Required Files section
-            self.available_files = sorted(files)
+            self.available_files = files
             
         except Exception as e:
             print(f"Error loading dataset files: {e}")
             messagebox.showerror("Error", f"Failed to load dataset files: {str(e)}")
     
+    @staticmethod
+    def _dir_mtime(path):
+        """Return a folder's mtime, or 0 if it does not exist."""
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return 0
+    
+    @classmethod
+    def _scan_dataset_files(cls, dataset_path):
+        """Return the scanned folders' mtimes and the sorted data files under raw/ and processed/."""
+        extensions = cls.DATA_FILE_EXTENSIONS
+        files = []
+        # Each mtime is taken before its folder is listed, so a change during the scan forces a re-scan
+        dir_mtimes = []
+        
+        # Raw files; scandir yields names and file types in one pass, without a stat per entry
+        raw_path = os.path.join(dataset_path, "raw")
+        dir_mtimes.append((raw_path, cls._dir_mtime(raw_path)))
+        if os.path.isdir(raw_path):
+            with os.scandir(raw_path) as entries:
+                files.extend(f"raw/{entry.name}" for entry in entries
+                             if entry.name.endswith(extensions) and entry.is_file())
+        
+        # Processed files, listed folder by folder with a '/'-separated relative prefix
+        pending = [("processed/", os.path.join(dataset_path, "processed"))]
+        while pending:
+            prefix, folder = pending.pop()
+            dir_mtimes.append((folder, cls._dir_mtime(folder)))
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append((f"{prefix}{entry.name}/", entry.path))
+                        elif entry.name.endswith(extensions):
+                            files.append(prefix + entry.name)
+            except OSError:
+                continue
+        
+        return tuple(dir_mtimes), sorted(files)
+    
     def load_all_modes(self):
         """Load all available modes for the inspection tab."""
         # Get all available modes from MODE_DEFINITIONS
@@ -647,8 +972,10 @@ class FigureGenerationGUI:
                                                font=("Arial", 10), foreground="gray")
         self.files_instruction_label.pack(pady=10)
         
-        # Clear stored widgets
+        # Clear stored widgets and the selections made with them
         self.file_selection_widgets = {}
+        self.selected_files = {}
+        self._required_file_names = ()
     
     def create_required_files_widgets(self, mode):
         """Create file selection widgets based on mode requirements."""
@@ -669,16 +996,21 @@ class FigureGenerationGUI:
         if not mode_config or 'required_files' not in mode_config:
             return
         
-        # Handle RasterPlot mode specifically
-        if mode == "RasterPlot":
-            self.create_rasterplot_file_widgets(mode_config)
-        elif mode == "MatrixVisualization":
-            self.create_matrix_visualization_file_widgets(mode_config)
-        elif mode == "TuningCurve":
-            self.create_tuning_curve_file_widgets(mode_config)
-        else:
-            # Generic file widgets for other modes
-            self.create_generic_file_widgets(mode_config)
+        # Index the mode's file requirements by name for the widget builders
+        self._mode_file_by_name = {req['name']: req for req in mode_config['required_files']}
+        self._required_file_names = tuple(req['name'] for req in mode_config['required_files']
+                                          if not req.get('optional', False))
+        
+        # Build the widgets while the container is unmapped so it is laid out once, not per widget
+        container = self.file_requirements_container
+        container.pack_forget()
+        try:
+            builder = self._file_widget_builders.get(mode, self.create_generic_file_widgets)
+            builder(mode_config)
+        finally:
+            # The container is the frame's only child, so re-packing keeps its place
+            container.pack(fill="x")
+            container.update_idletasks()
     
     def create_generic_file_widgets(self, mode_config):
         """Create generic file selection widgets."""
@@ -700,9 +1032,8 @@ class FigureGenerationGUI:
             file_combo.grid(row=0, column=1, padx=5, pady=2)
             
             # Populate with appropriate files based on file types
-            if hasattr(self, 'available_files'):
-                compatible_files = self.filter_files_by_type(mode_config['file_types'])
-                file_combo['values'] = compatible_files
+            compatible_files = self.filter_files_by_type(mode_config['file_types'])
+            self.set_file_choices(file_combo, compatible_files)
             
             # Bind change event
             file_combo.bind('<<ComboboxSelected>>', self.on_required_file_change)
@@ -747,9 +1078,8 @@ class FigureGenerationGUI:
         raster_combo.grid(row=0, column=1, padx=5, pady=2)
         
         # Filter for Raster_matrix* .npy files
-        if hasattr(self, 'available_files'):
-            raster_files = self.filter_files_by_type([".npy"], "Raster_matrix*")
-            raster_combo['values'] = raster_files
+        raster_files = self.filter_files_by_type([".npy"], "Raster_matrix*")
+        self.set_file_choices(raster_combo, raster_files)
         
         raster_combo.bind('<<ComboboxSelected>>', self.on_required_file_change)
         
@@ -758,7 +1088,7 @@ class FigureGenerationGUI:
             'var': raster_var,
             'combo': raster_combo,
             'frame': raster_frame,
-            'config': mode_config['required_files'][0]
+            'config': self._mode_file_by_name['raster_matrix']
         }
         
         # Row Labels section
@@ -772,9 +1102,8 @@ class FigureGenerationGUI:
         row_labels_combo.grid(row=0, column=1, padx=5, pady=2)
         
         # Filter for *row_labels* .csv files
-        if hasattr(self, 'available_files'):
-            row_label_files = self.filter_files_by_type([".csv"], "*row_labels*")
-            row_labels_combo['values'] = row_label_files
+        row_label_files = self.filter_files_by_type([".csv"], "*row_labels*")
+        self.set_file_choices(row_labels_combo, row_label_files)
         
         row_labels_combo.bind('<<ComboboxSelected>>', self.on_required_file_change)
         
@@ -785,7 +1114,7 @@ class FigureGenerationGUI:
         # Number input for row label count
         row_count_entry = ttk.Entry(row_labels_frame, textvariable=self.raster_row_label_count, width=5)
         row_count_entry.grid(row=0, column=3, padx=2)
-        row_count_entry.bind('<KeyRelease>', lambda e: self.update_inspection_figure())
+        row_count_entry.bind('<KeyRelease>', self.schedule_inspection_update)
         
         # Row title input
         row_title_frame = ttk.Frame(self.file_requirements_container)
@@ -793,14 +1122,14 @@ class FigureGenerationGUI:
         ttk.Label(row_title_frame, text="Row Title:").grid(row=0, column=0, sticky="w", padx=5)
         row_title_entry = ttk.Entry(row_title_frame, textvariable=self.raster_row_title, width=20)
         row_title_entry.grid(row=0, column=1, padx=5, pady=2)
-        row_title_entry.bind('<KeyRelease>', lambda e: self.update_inspection_figure())
+        row_title_entry.bind('<KeyRelease>', self.update_raster_titles)
         
         # Store reference
         self.file_selection_widgets['row_labels'] = {
             'var': row_labels_var,
             'combo': row_labels_combo,
             'frame': row_labels_frame,
-            'config': mode_config['required_files'][1]
+            'config': self._mode_file_by_name['row_labels']
         }
         
         # Column Labels section
@@ -814,9 +1143,8 @@ class FigureGenerationGUI:
         column_labels_combo.grid(row=0, column=1, padx=5, pady=2)
         
         # Filter for *column_labels* .csv files
-        if hasattr(self, 'available_files'):
-            column_label_files = self.filter_files_by_type([".csv"], "*column_labels*")
-            column_labels_combo['values'] = column_label_files
+        column_label_files = self.filter_files_by_type([".csv"], "*column_labels*")
+        self.set_file_choices(column_labels_combo, column_label_files)
         
         column_labels_combo.bind('<<ComboboxSelected>>', self.on_required_file_change)
         
@@ -827,7 +1155,7 @@ class FigureGenerationGUI:
         # Number input for column label count
         column_count_entry = ttk.Entry(column_labels_frame, textvariable=self.raster_column_label_count, width=5)
         column_count_entry.grid(row=0, column=3, padx=2)
-        column_count_entry.bind('<KeyRelease>', lambda e: self.update_inspection_figure())
+        column_count_entry.bind('<KeyRelease>', self.schedule_inspection_update)
         
         # Column title input
         column_title_frame = ttk.Frame(self.file_requirements_container)
@@ -835,14 +1163,14 @@ class FigureGenerationGUI:
         ttk.Label(column_title_frame, text="Column Title:").grid(row=0, column=0, sticky="w", padx=5)
         column_title_entry = ttk.Entry(column_title_frame, textvariable=self.raster_column_title, width=20)
         column_title_entry.grid(row=0, column=1, padx=5, pady=2)
-        column_title_entry.bind('<KeyRelease>', lambda e: self.update_inspection_figure())
+        column_title_entry.bind('<KeyRelease>', self.update_raster_titles)
         
         # Store reference
         self.file_selection_widgets['column_labels'] = {
             'var': column_labels_var,
             'combo': column_labels_combo,
             'frame': column_labels_frame,
-            'config': mode_config['required_files'][2]
+            'config': self._mode_file_by_name['column_labels']
         }
         
         # Annotation section
@@ -856,9 +1184,8 @@ class FigureGenerationGUI:
         annotation_combo.grid(row=0, column=1, padx=5, pady=2)
         
         # Populate with binary vector files
-        if hasattr(self, 'available_files'):
-            binary_vector_files = self.detect_binary_vector_files()
-            annotation_combo['values'] = binary_vector_files
+        binary_vector_files = self.detect_binary_vector_files()
+        self.set_file_choices(annotation_combo, binary_vector_files)
         
         annotation_combo.bind('<<ComboboxSelected>>', self.on_required_file_change)
         
@@ -872,7 +1199,7 @@ class FigureGenerationGUI:
         ttk.Label(annotation_name_frame, text="Annotation Name:").grid(row=0, column=0, sticky="w", padx=5)
         annotation_name_entry = ttk.Entry(annotation_name_frame, textvariable=self.raster_annotation_name, width=30)
         annotation_name_entry.grid(row=0, column=1, padx=5, pady=2)
-        annotation_name_entry.bind('<KeyRelease>', lambda e: self.update_inspection_figure())
+        annotation_name_entry.bind('<KeyRelease>', self.schedule_inspection_update)
         
         # Bind annotation file selection to update name field
         def on_annotation_file_change(event=None):
@@ -890,7 +1217,7 @@ class FigureGenerationGUI:
             'var': annotation_var,
             'combo': annotation_combo,
             'frame': annotation_frame,
-            'config': mode_config['required_files'][3],
+            'config': self._mode_file_by_name['annotation'],
             'name_var': self.raster_annotation_name,
             'name_entry': annotation_name_entry
         }
@@ -908,13 +1235,12 @@ class FigureGenerationGUI:
         matrix_combo.grid(row=0, column=1, padx=5, pady=2)
         
         # Filter for .npy files and prioritize Ruzicka files
-        if hasattr(self, 'available_files'):
-            npy_files = self.filter_files_by_type([".npy"])
-            # Sort so Ruzicka files appear first
-            ruzicka_files = [f for f in npy_files if os.path.basename(f).startswith("Ruzicka")]
-            other_files = [f for f in npy_files if not os.path.basename(f).startswith("Ruzicka")]
-            sorted_files = ruzicka_files + other_files
-            matrix_combo['values'] = sorted_files
+        npy_files = self.filter_files_by_type([".npy"])
+        # Sort so Ruzicka files appear first
+        ruzicka_files = [f for f in npy_files if os.path.basename(f).startswith("Ruzicka")]
+        other_files = [f for f in npy_files if not os.path.basename(f).startswith("Ruzicka")]
+        sorted_files = ruzicka_files + other_files
+        self.set_file_choices(matrix_combo, sorted_files)
         
         matrix_combo.bind('<<ComboboxSelected>>', self.on_required_file_change)
         
@@ -923,7 +1249,7 @@ class FigureGenerationGUI:
             'var': matrix_var,
             'combo': matrix_combo,
             'frame': matrix_frame,
-            'config': mode_config['required_files'][0]
+            'config': self._mode_file_by_name['matrix']
         }
         
         # Aesthetic toggle checkbox
@@ -971,9 +1297,8 @@ class FigureGenerationGUI:
         raster_combo.grid(row=0, column=1, padx=5, pady=2)
         
         # Filter for Raster_matrix* .npy files
-        if hasattr(self, 'available_files'):
-            raster_files = self.filter_files_by_type([".npy"], "Raster_matrix*")
-            raster_combo['values'] = raster_files
+        raster_files = self.filter_files_by_type([".npy"], "Raster_matrix*")
+        self.set_file_choices(raster_combo, raster_files)
         
         raster_combo.bind('<<ComboboxSelected>>', self.on_required_file_change)
         
@@ -982,7 +1307,7 @@ class FigureGenerationGUI:
             'var': raster_var,
             'combo': raster_combo,
             'frame': raster_frame,
-            'config': mode_config['required_files'][0]
+            'config': self._mode_file_by_name['raster_matrix']
         }
         
         # Annotation File selection
@@ -996,9 +1321,8 @@ class FigureGenerationGUI:
         annotation_combo.grid(row=0, column=1, padx=5, pady=2)
         
         # Populate with binary vector files
-        if hasattr(self, 'available_files'):
-            binary_vector_files = self.detect_binary_vector_files()
-            annotation_combo['values'] = binary_vector_files
+        binary_vector_files = self.detect_binary_vector_files()
+        self.set_file_choices(annotation_combo, binary_vector_files)
         
         annotation_combo.bind('<<ComboboxSelected>>', self.on_required_file_change)
         
@@ -1007,7 +1331,7 @@ class FigureGenerationGUI:
             'var': annotation_var,
             'combo': annotation_combo,
             'frame': annotation_frame,
-            'config': mode_config['required_files'][1]
+            'config': self._mode_file_by_name['annotation']
         }
         
         # Time Conversion Controls (moved from Figure Controls to reduce window height)
@@ -1026,7 +1350,7 @@ class FigureGenerationGUI:
         ttk.Label(time_conv_frame, text="Frame Rate (Hz):").grid(row=0, column=1, sticky="w", padx=5)
         framerate_entry = ttk.Entry(time_conv_frame, textvariable=self.tuning_framerate, width=10)
         framerate_entry.grid(row=0, column=2, padx=5, pady=2)
-        framerate_entry.bind('<KeyRelease>', lambda e: self.update_inspection_figure())
+        framerate_entry.bind('<KeyRelease>', self.schedule_inspection_update)
         
         # === RIGHT SIDE: Controls ===
         
@@ -1038,13 +1362,13 @@ class FigureGenerationGUI:
         frames_before_spinbox = ttk.Spinbox(time_frame, textvariable=self.tuning_frames_before, 
                                           from_=0, to=1000, width=6)
         frames_before_spinbox.grid(row=0, column=1, padx=2, pady=1)
-        frames_before_spinbox.bind('<KeyRelease>', lambda e: self.update_inspection_figure())
+        frames_before_spinbox.bind('<KeyRelease>', self.schedule_inspection_update)
         
         ttk.Label(time_frame, text="After:").grid(row=1, column=0, sticky="w", padx=2)
         frames_after_spinbox = ttk.Spinbox(time_frame, textvariable=self.tuning_frames_after, 
                                          from_=0, to=1000, width=6)
         frames_after_spinbox.grid(row=1, column=1, padx=2, pady=1)
-        frames_after_spinbox.bind('<KeyRelease>', lambda e: self.update_inspection_figure())
+        frames_after_spinbox.bind('<KeyRelease>', self.schedule_inspection_update)
         
         # Neuron Navigation Controls
         nav_frame = ttk.LabelFrame(right_frame, text="Neuron Navigation", padding=5)
@@ -1056,42 +1380,81 @@ class FigureGenerationGUI:
         neuron_spinbox = ttk.Spinbox(nav_frame, textvariable=self.tuning_current_neuron, 
                                    from_=1, to=1000, width=6)
         neuron_spinbox.grid(row=0, column=1, padx=2, pady=1)
-        neuron_spinbox.bind('<KeyRelease>', lambda e: self.update_inspection_figure())
+        neuron_spinbox.bind('<KeyRelease>', self.schedule_inspection_update)
         
         ttk.Button(nav_frame, text="▶", width=3,
                   command=self.next_neuron).grid(row=0, column=2, padx=1)
     
     def filter_files_by_type(self, allowed_extensions, pattern=None):
-        """Filter available files by allowed extensions and optional pattern."""
-        if not hasattr(self, 'available_files'):
-            return []
-        
-        filtered_files = []
-        for file_path in self.available_files:
-            file_ext = os.path.splitext(file_path)[1].lower()
-            filename = os.path.basename(file_path)
-            
-            # Check extension
-            if file_ext not in allowed_extensions:
-                continue
-                
-            # Check pattern if provided
-            if pattern:
-                import fnmatch
-                if not fnmatch.fnmatch(filename, pattern + file_ext):
-                    continue
+        """Filter available files by allowed extensions and optional pattern.
+        
+        Results are memoized per (extensions, pattern) until the file list changes.
+        """
+        if not self.available_files:
+            return ()
+        
+        # Bucket the file list by extension once per scan
+        if self._file_index_source is not self.available_files:
+            self._file_index_source = self.available_files
+            self._files_by_ext = {}
+            self._file_index = {}
+            for file_path in self.available_files:
+                file_ext = os.path.splitext(file_path)[1].lower()
+                filename = os.path.normcase(os.path.basename(file_path))
+                self._files_by_ext.setdefault(file_ext, []).append((file_path, filename))
+        
+        # Extensions are matched as a lowercase set, so order, case and duplicates don't matter
+        extensions = frozenset(file_ext.lower() for file_ext in allowed_extensions)
+        key = (extensions, pattern)
+        filtered_files = self._file_index.get(key)
+        if filtered_files is None:
+            matches = []
+            for file_ext in extensions:
+                bucket = self._files_by_ext.get(file_ext, ())
+                if pattern:
+                    # Check pattern if provided
+                    match = _glob_regex(os.path.normcase(pattern + file_ext))
+                    matches.extend(file_path for file_path, filename in bucket if match(filename))
+                else:
+                    matches.extend(file_path for file_path, _ in bucket)
             
-            filtered_files.append(file_path)
+            # Keep the order of the (sorted) file list
+            filtered_files = tuple(sorted(matches)) if len(extensions) > 1 else tuple(matches)
+            self._file_index[key] = filtered_files
         
         return filtered_files
     
+    def set_file_choices(self, combo, files):
+        """Fill a file dropdown; very long lists become searchable by typed path prefix."""
+        if len(files) <= self.FILE_COMBO_LIMIT:
+            combo['values'] = files
+            return
+        
+        # Show the first entries and let typing narrow the list through a sorted index
+        sorted_files = sorted(files)
+        combo.configure(state="normal", values=files[:self.FILE_COMBO_LIMIT])
+        
+        def on_key(event):
+            # The typed text is the selection, so validation sees what is on screen
+            self.record_file_selection(combo)
+            if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+                return
+            prefix = combo.get()
+            start = bisect_left(sorted_files, prefix)
+            end = bisect_left(sorted_files, prefix + "\uffff", start)
+            combo['values'] = sorted_files[start:min(end, start + self.FILE_COMBO_LIMIT)]
+        
+        combo.bind('<KeyRelease>', on_key)
+        # Return confirms a typed path like picking it from the list
+        combo.bind('<Return>', self.on_required_file_change)
+    
     def detect_binary_vector_files(self):
         """Detect CSV files that contain binary 1D vectors (only 0s and 1s)."""
-        if not hasattr(self, 'available_files') or not self.selected_dataset:
+        if not self.available_files or not self.selected_dataset:
             return []
         
         binary_vector_files = []
-        dataset_path = os.path.join("data", "datasets", self.selected_dataset.name)
+        dataset_path = self.get_dataset_path()
         
         # Only check CSV files in the matrices folder
         csv_files = [f for f in self.available_files if f.endswith('.csv') and 'matrices' in f]
@@ -1105,13 +1468,13 @@ class FigureGenerationGUI:
                 if 'raster_matrix' in filename and not ('row_labels' in filename or 'column_labels' in filename):
                     continue
                 
-                # Read the CSV file
-                df = pd.read_csv(full_path)
-                
-                # Check if it's a single column (1D vector)
-                if df.shape[1] != 1:
+                # Check if it's a single column (1D vector) from the header alone, so wide tables are never parsed
+                if len(pd.read_csv(full_path, nrows=0).columns) != 1:
                     continue
                 
+                # Read the CSV file
+                df = self._read_labels(full_path)
+                
                 # Get the data column (skip header)
                 data_column = df.iloc[:, 0]
                 
@@ -1138,6 +1501,8 @@ class FigureGenerationGUI:
     
     def on_required_file_change(self, event=None):
         """Handle changes in required file selections."""
+        self.record_file_selection(event.widget if event is not None else None)
+        
         # Update sorting vectors when label files change (for RasterPlot and MatrixVisualization modes)
         if hasattr(self, 'selected_mode') and (self.selected_mode == "RasterPlot" or self.selected_mode == "MatrixVisualization"):
             self.update_sorting_vectors_from_labels()
@@ -1152,29 +1517,21 @@ class FigureGenerationGUI:
     
     def validate_required_files(self):
         """Validate that all required (non-optional) files are selected."""
-        mode = self.inspection_mode_var.get()
-        
-        # For RasterPlot, only raster_matrix is required
-        if mode == "RasterPlot":
-            return 'raster_matrix' in self.file_selection_widgets and self.file_selection_widgets['raster_matrix']['var'].get()
-        
-        # For MatrixVisualization, only matrix is required
-        elif mode == "MatrixVisualization":
-            return 'matrix' in self.file_selection_widgets and self.file_selection_widgets['matrix']['var'].get()
-        
-        # For TuningCurve, both raster_matrix and annotation are required
-        elif mode == "TuningCurve":
-            return ('raster_matrix' in self.file_selection_widgets and 
-                    self.file_selection_widgets['raster_matrix']['var'].get() and
-                    'annotation' in self.file_selection_widgets and 
-                    self.file_selection_widgets['annotation']['var'].get())
-        
-        # For other modes, check all non-optional files
+        # Only the required selections are checked (e.g. just raster_matrix for RasterPlot)
+        return all(self.selected_files.get(file_name) for file_name in self._required_file_names)
+    
+    def record_file_selection(self, combo=None):
+        """Update selected_files for the combobox that changed, or re-read every selection if unknown."""
         for file_name, widget_info in self.file_selection_widgets.items():
-            if not widget_info['config'].get('optional', False):
-                if not widget_info['var'].get():
-                    return False
-        return True
+            if combo is not None and widget_info['combo'] is not combo:
+                continue
+            file_path = widget_info['var'].get()
+            if file_path:
+                self.selected_files[file_name] = file_path
+            else:
+                self.selected_files.pop(file_name, None)
+            if combo is not None:
+                break
     
     def load_selected_files_and_display(self):
         """Load all selected files and display the figure."""
@@ -1182,18 +1539,12 @@ class FigureGenerationGUI:
             return
         
         try:
-            # Load all selected files
-            self.selected_files = {}
-            for file_name, widget_info in self.file_selection_widgets.items():
-                file_path = widget_info['var'].get()
-                if file_path:
-                    self.selected_files[file_name] = file_path
-            
-            # Load the primary data file for figure generation
-            if self.selected_files:
-                primary_file_name = list(self.selected_files.keys())[0]
-                self.selected_file = self.selected_files[primary_file_name]
-                self.load_and_display_data()
+            # Load the primary data file (the first selected in widget order) for figure generation
+            for file_name in self.file_selection_widgets:
+                if file_name in self.selected_files:
+                    self.selected_file = self.selected_files[file_name]
+                    self.load_and_display_data()
+                    break
         
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load selected files: {str(e)}")
@@ -1315,7 +1666,7 @@ class FigureGenerationGUI:
         index_point_spinbox = ttk.Spinbox(quantifications_frame, textvariable=self.tuning_index_point, 
                                         from_=-1000, to=1000, width=8)
         index_point_spinbox.grid(row=0, column=3, padx=5, pady=2)
-        index_point_spinbox.bind('<KeyRelease>', lambda e: self.update_inspection_figure())
+        index_point_spinbox.bind('<KeyRelease>', self.schedule_inspection_update)
         
         # Save AUC button (positioned on the right side)
         ttk.Button(quantifications_frame, text="Save AUC", 
@@ -1330,13 +1681,13 @@ class FigureGenerationGUI:
         auc_start_spinbox = ttk.Spinbox(quantifications_frame, textvariable=self.tuning_auc_start, 
                                       from_=-1000, to=1000, width=8)
         auc_start_spinbox.grid(row=1, column=3, padx=5, pady=2)
-        auc_start_spinbox.bind('<KeyRelease>', lambda e: self.update_inspection_figure())
+        auc_start_spinbox.bind('<KeyRelease>', self.schedule_inspection_update)
         
         ttk.Label(quantifications_frame, text="AUC end:").grid(row=2, column=2, sticky="w", padx=5)
         auc_end_spinbox = ttk.Spinbox(quantifications_frame, textvariable=self.tuning_auc_end, 
                                     from_=-1000, to=1000, width=8)
         auc_end_spinbox.grid(row=2, column=3, padx=5, pady=2)
-        auc_end_spinbox.bind('<KeyRelease>', lambda e: self.update_inspection_figure())
+        auc_end_spinbox.bind('<KeyRelease>', self.schedule_inspection_update)
 
     def toggle_sorting_section(self, mode):
         """Show or hide the sorting section based on the selected mode."""
@@ -1358,22 +1709,21 @@ class FigureGenerationGUI:
             return
         
         try:
-            dataset_path = os.path.join("data", "datasets", self.selected_dataset.name)
+            dataset_path = self.get_dataset_path()
             
             # Auto-detect row labels files and get sorting options
             row_sorting_options = []
-            if hasattr(self, 'available_files'):
-                row_label_files = self.filter_files_by_type([".csv"], "*row_labels*")
-                if row_label_files:
-                    # Use the first available row labels file
-                    row_labels_path = os.path.join(dataset_path, row_label_files[0])
-                    if os.path.exists(row_labels_path):
-                        try:
-                            row_labels_df = pd.read_csv(row_labels_path)
-                            # Get all columns except 'row_labels'
-                            row_sorting_options = [col for col in row_labels_df.columns if col != 'row_labels']
-                        except Exception as e:
-                            print(f"Error reading row labels file {row_label_files[0]}: {e}")
+            row_label_files = self.filter_files_by_type([".csv"], "*row_labels*")
+            if row_label_files:
+                # Use the first available row labels file
+                row_labels_path = os.path.join(dataset_path, row_label_files[0])
+                if os.path.exists(row_labels_path):
+                    try:
+                        row_labels_df = self._read_labels(row_labels_path)
+                        # Get all columns except 'row_labels'
+                        row_sorting_options = [col for col in row_labels_df.columns if col != 'row_labels']
+                    except Exception as e:
+                        print(f"Error reading row labels file {row_label_files[0]}: {e}")
             
             # For MatrixVisualization mode, use row sorting vectors for both row and column sorting
             # since Ruzicka matrices are square matrices where both dimensions represent the same neurons
@@ -1382,18 +1732,17 @@ class FigureGenerationGUI:
             else:
                 # Auto-detect column labels files and get sorting options  
                 column_sorting_options = []
-                if hasattr(self, 'available_files'):
-                    column_label_files = self.filter_files_by_type([".csv"], "*column_labels*")
-                    if column_label_files:
-                        # Use the first available column labels file
-                        column_labels_path = os.path.join(dataset_path, column_label_files[0])
-                        if os.path.exists(column_labels_path):
-                            try:
-                                column_labels_df = pd.read_csv(column_labels_path)
-                                # Get all columns except 'column_labels'
-                                column_sorting_options = [col for col in column_labels_df.columns if col != 'column_labels']
-                            except Exception as e:
-                                print(f"Error reading column labels file {column_label_files[0]}: {e}")
+                column_label_files = self.filter_files_by_type([".csv"], "*column_labels*")
+                if column_label_files:
+                    # Use the first available column labels file
+                    column_labels_path = os.path.join(dataset_path, column_label_files[0])
+                    if os.path.exists(column_labels_path):
+                        try:
+                            column_labels_df = self._read_labels(column_labels_path)
+                            # Get all columns except 'column_labels'
+                            column_sorting_options = [col for col in column_labels_df.columns if col != 'column_labels']
+                        except Exception as e:
+                            print(f"Error reading column labels file {column_label_files[0]}: {e}")
             
             # Update dropdowns
             self.row_sorting_vector_combo['values'] = row_sorting_options
@@ -1424,14 +1773,25 @@ class FigureGenerationGUI:
         if hasattr(self, 'selected_mode') and self.selected_mode == "MatrixVisualization":
             self.update_inspection_figure()
     
+    def sorting_state(self):
+        """Return the current row/column sorting settings as a comparable tuple."""
+        row_state = None
+        if self.sort_rows_var.get():
+            row_state = (self.row_sorting_vector_var.get(), self.row_sort_ascending_var.get())
+        column_state = None
+        if self.sort_columns_var.get():
+            column_state = (self.column_sorting_vector_var.get(), self.column_sort_ascending_var.get())
+        return row_state, column_state
+    
     def apply_sorting_to_matrix(self, matrix, row_labels=None, column_labels=None):
         """Apply sorting to the matrix based on current sorting settings."""
         if matrix is None:
             return matrix, row_labels, column_labels
         
-        sorted_matrix = matrix.copy()
-        sorted_row_labels = row_labels.copy() if row_labels is not None else None
-        sorted_column_labels = column_labels.copy() if column_labels is not None else None
+        # Sorting takes new arrays and frames by indexing, so the (possibly shared) inputs are never modified
+        sorted_matrix = matrix
+        sorted_row_labels = row_labels
+        sorted_column_labels = column_labels
         
         try:
             # Apply row sorting
@@ -1478,44 +1838,57 @@ class FigureGenerationGUI:
             messagebox.showerror("Sorting Error", f"Error applying sorting: {str(e)}. Using original order.")
             return matrix, row_labels, column_labels
     
+    def _read_labels(self, path):
+        """Read a label/annotation CSV, reusing the parsed frame until the file changes.
+        
+        The returned DataFrame is shared between callers and must not be modified in place.
+        """
+        mtime = os.stat(path).st_mtime
+        with self._label_lock:
+            cached = self._label_cache.pop(path, None)
+            if cached and cached[0] == mtime:
+                # Re-insert so the dict stays in least-recently-used order
+                self._label_cache[path] = cached
+                return cached[1]
+        
+        labels_df = pd.read_csv(path, engine=CSV_ENGINE)
+        
+        # Loader threads share the cache; evict the least recently used entry once it is full
+        with self._label_lock:
+            if len(self._label_cache) >= self.LABEL_CACHE_SIZE:
+                del self._label_cache[next(iter(self._label_cache))]
+            self._label_cache[path] = (mtime, labels_df)
+        return labels_df
+    
     def load_sorting_vector(self, column_name, vector_type):
         """Load a sorting vector from the appropriate label file."""
         if not self.selected_dataset or not column_name:
             return None
         
         try:
-            dataset_path = os.path.join("data", "datasets", self.selected_dataset.name)
+            dataset_path = self.get_dataset_path()
             
             # Auto-detect the appropriate label file based on vector_type
             if vector_type == 'row':
-                if hasattr(self, 'available_files'):
-                    row_label_files = self.filter_files_by_type([".csv"], "*row_labels*")
-                    if not row_label_files:
-                        raise ValueError("No row labels files found")
-                    labels_file = row_label_files[0]  # Use the first available file
-                else:
-                    raise ValueError("Available files not loaded")
+                row_label_files = self.filter_files_by_type([".csv"], "*row_labels*")
+                if not row_label_files:
+                    raise ValueError("No row labels files found")
+                labels_file = row_label_files[0]  # Use the first available file
                     
             elif vector_type == 'column':
                 # For MatrixVisualization mode, use row labels for column sorting
                 # since Ruzicka matrices are square matrices where both dimensions represent the same neurons
                 if hasattr(self, 'selected_mode') and self.selected_mode == "MatrixVisualization":
-                    if hasattr(self, 'available_files'):
-                        row_label_files = self.filter_files_by_type([".csv"], "*row_labels*")
-                        if not row_label_files:
-                            raise ValueError("No row labels files found")
-                        labels_file = row_label_files[0]  # Use row labels file for column sorting
-                    else:
-                        raise ValueError("Available files not loaded")
+                    row_label_files = self.filter_files_by_type([".csv"], "*row_labels*")
+                    if not row_label_files:
+                        raise ValueError("No row labels files found")
+                    labels_file = row_label_files[0]  # Use row labels file for column sorting
                 else:
                     # For other modes, use column labels files
-                    if hasattr(self, 'available_files'):
-                        column_label_files = self.filter_files_by_type([".csv"], "*column_labels*")
-                        if not column_label_files:
-                            raise ValueError("No column labels files found")
-                        labels_file = column_label_files[0]  # Use the first available file
-                    else:
-                        raise ValueError("Available files not loaded")
+                    column_label_files = self.filter_files_by_type([".csv"], "*column_labels*")
+                    if not column_label_files:
+                        raise ValueError("No column labels files found")
+                    labels_file = column_label_files[0]  # Use the first available file
             else:
                 raise ValueError(f"Invalid vector_type: {vector_type}. Must be 'row' or 'column'")
             
@@ -1526,7 +1899,7 @@ class FigureGenerationGUI:
                 raise FileNotFoundError(f"Labels file not found: {file_path}")
             
             # Load the CSV file
-            vector_data = pd.read_csv(file_path)
+            vector_data = self._read_labels(file_path)
             
             # Check if the requested column exists
             if column_name not in vector_data.columns:
@@ -1568,59 +1941,88 @@ class FigureGenerationGUI:
             return self.current_raster_data.shape[0]
         return 1000  # Default fallback
     def load_and_display_data(self):
-        """Load the selected file and display initial figure."""
+        """Load the selected file on a worker thread and display initial figure."""
         if not self.selected_file or not self.selected_dataset:
             return
         
+        # Construct full file path
+        dataset_path = self.get_dataset_path()
+        file_path = os.path.join(dataset_path, self.selected_file)
+        
+        self._inspection_load_token += 1
+        self._run_in_background(self._read_data_file_worker, self._inspection_load_token, file_path)
+    
+    def _read_data_file_worker(self, token, file_path):
+        """Read an inspection data file into a DataFrame (worker thread)."""
         try:
-            # Construct full file path
-            dataset_path = os.path.join("data", "datasets", self.selected_dataset.name)
-            file_path = os.path.join(dataset_path, self.selected_file)
-            
-            # Load data based on file extension
-            file_ext = os.path.splitext(file_path)[1].lower()
-            
-            if file_ext == '.csv':
-                self.current_data = pd.read_csv(file_path)
-            elif file_ext == '.txt':
-                # Try to read as CSV first, then as plain text
-                try:
-                    self.current_data = pd.read_csv(file_path, sep='\t')
-                except:
-                    self.current_data = pd.read_csv(file_path, sep=None, engine='python')
-            elif file_ext == '.npy':
-                data_array = np.load(file_path)
-                # Convert to DataFrame if 2D, otherwise create simple DataFrame
-                if data_array.ndim == 2:
-                    self.current_data = pd.DataFrame(data_array)
-                else:
-                    self.current_data = pd.DataFrame({'data': data_array})
-            elif file_ext == '.npz':
-                data_dict = np.load(file_path)
+            data = self.read_data_file(file_path)
+            error = None
+        except Exception as e:
+            data = None
+            error = e
+        self._ui_queue.put((self._on_data_file_loaded, (token, data, error)))
+    
+    @staticmethod
+    def read_data_file(file_path):
+        """Read a csv/txt/npy/npz file into a DataFrame."""
+        # Load data based on file extension
+        file_ext = os.path.splitext(file_path)[1].lower()
+        
+        # Text files are parsed straight from a memory map instead of through a buffered read
+        if file_ext == '.csv':
+            return pd.read_csv(file_path, memory_map=True)
+        elif file_ext == '.txt':
+            # Try to read as CSV first, then as plain text
+            try:
+                return pd.read_csv(file_path, sep='\t', memory_map=True)
+            except:
+                return pd.read_csv(file_path, sep=None, engine='python', memory_map=True)
+        elif file_ext == '.npy':
+            data_array = np.load(file_path, mmap_mode='r')
+            # Convert to DataFrame if 2D, otherwise create simple DataFrame
+            if data_array.ndim == 2:
+                return pd.DataFrame(data_array)
+            else:
+                return pd.DataFrame({'data': data_array})
+        elif file_ext == '.npz':
+            with np.load(file_path, allow_pickle=False) as data_dict:
                 # Use first array or combine multiple arrays
                 if len(data_dict.files) == 1:
                     data_array = data_dict[data_dict.files[0]]
                     if data_array.ndim == 2:
-                        self.current_data = pd.DataFrame(data_array)
+                        return pd.DataFrame(data_array)
                     else:
-                        self.current_data = pd.DataFrame({'data': data_array})
+                        return pd.DataFrame({'data': data_array})
                 else:
+                    # Refuse mismatched arrays before decompressing any of them
+                    sizes = _npz_array_sizes(file_path)
+                    if len(set(sizes.values())) > 1:
+                        raise ValueError(f"Arrays in {os.path.basename(file_path)} have different lengths: {sizes}")
+                    
                     # Combine multiple arrays as columns
-                    data_dict_pd = {key: data_dict[key].flatten() for key in data_dict.files}
-                    self.current_data = pd.DataFrame(data_dict_pd)
-            else:
-                messagebox.showerror("Error", f"Unsupported file format: {file_ext}")
-                return
-            
-            # Update column selections for relevant controls
-            self.update_column_controls()
-            
-            # Generate initial figure
-            self.update_inspection_figure()
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load data: {str(e)}")
-            print(f"Error loading data: {e}")
+                    data_dict_pd = {key: data_dict[key].ravel() for key in data_dict.files}
+                    return pd.DataFrame(data_dict_pd)
+        else:
+            raise ValueError(f"Unsupported file format: {file_ext}")
+    
+    def _on_data_file_loaded(self, payload):
+        """Display a data file read by _read_data_file_worker."""
+        token, data, error = payload
+        if token != self._inspection_load_token:
+            return
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to load data: {str(error)}")
+            print(f"Error loading data: {error}")
+            return
+        
+        self.current_data = data
+        
+        # Update column selections for relevant controls
+        self.update_column_controls()
+        
+        # Generate initial figure
+        self.update_inspection_figure()
     
     def update_column_controls(self):
         """Update column-based controls when data is loaded."""
@@ -1631,17 +2033,62 @@ class FigureGenerationGUI:
         # For now, it's a placeholder that can be used by custom modes
         pass
     
+    def schedule_inspection_update(self, event=None):
+        """Redraw the inspection figure once typing in a control pauses."""
+        if self._inspection_update_after is not None:
+            self.window.after_cancel(self._inspection_update_after)
+        self._inspection_update_after = self.window.after(self.INSPECTION_UPDATE_DELAY_MS,
+                                                          self._run_scheduled_inspection_update)
+    
+    def _run_scheduled_inspection_update(self):
+        """Run a redraw scheduled by schedule_inspection_update."""
+        self._inspection_update_after = None
+        self.update_inspection_figure()
+    
+    def update_raster_titles(self, event=None):
+        """Apply row/column title edits by blitting only the axis labels over a saved background."""
+        ax = self._raster_titles_ax
+        if ax is None or ax is not self.inspection_ax or ax.figure is not self.inspection_fig:
+            # No RasterPlot on screen; fall back to a full (debounced) redraw
+            self.schedule_inspection_update()
+            return
+        
+        canvas = self.figure_canvas
+        labels = (ax.xaxis.label, ax.yaxis.label)
+        try:
+            # Save the figure without the titles once per raster render (and after resizes)
+            if self._raster_bg is None or self._raster_bg_bounds != self.inspection_fig.bbox.bounds:
+                for label in labels:
+                    label.set_visible(False)
+                canvas.draw()
+                self._raster_bg = canvas.copy_from_bbox(self.inspection_fig.bbox)
+                self._raster_bg_bounds = self.inspection_fig.bbox.bounds
+                for label in labels:
+                    label.set_visible(True)
+            
+            ax.set_xlabel(self.raster_column_title.get())
+            ax.set_ylabel(self.raster_row_title.get())
+            
+            canvas.restore_region(self._raster_bg)
+            for label in labels:
+                ax.draw_artist(label)
+            canvas.blit(self.inspection_fig.bbox)
+        except Exception as e:
+            print(f"Error updating raster titles: {e}")
+            self.schedule_inspection_update()
+    
     def update_inspection_figure(self):
         """Update the inspection figure based on current mode and parameters."""
         if self.current_data is None or not hasattr(self, 'inspection_ax'):
             return
         
         try:
-            # Clear current plot
-            self.inspection_ax.clear()
-            
             mode = self.inspection_mode_var.get()
             
+            # Clear current plot; RasterPlot updates its existing image in place when it can
+            if mode != "RasterPlot":
+                self.inspection_ax.clear()
+            
             # Generate figure based on mode configuration
             if mode in self.MODE_DEFINITIONS:
                 self.generate_custom_mode_figure(mode)
@@ -1658,9 +2105,10 @@ class FigureGenerationGUI:
             
             self.inspection_ax.grid(True, alpha=0.3)
             
-            # Refresh canvas
-            self.inspection_fig.tight_layout()
-            self.figure_canvas.draw()
+            # Refresh canvas; a RasterPlot whose labels and titles are unchanged keeps its layout
+            if mode != "RasterPlot" or self._raster_relayout:
+                self.inspection_fig.tight_layout()
+            self.figure_canvas.draw_idle()
             
         except Exception as e:
             # Display error message on plot
@@ -1668,13 +2116,11 @@ class FigureGenerationGUI:
             self.inspection_ax.text(0.5, 0.5, f'Error generating plot:\n{str(e)}', 
                                   ha='center', va='center', transform=self.inspection_ax.transAxes,
                                   fontsize=10, color='red')
-            self.figure_canvas.draw()
+            self.figure_canvas.draw_idle()
             print(f"Error updating figure: {e}")
     
     def generate_custom_mode_figure(self, mode):
         """Generate figure for custom modes based on their configuration."""
-        mode_config = self.MODE_DEFINITIONS[mode]
-        
         if mode == "RasterPlot":
             self.generate_rasterplot_figure()
         elif mode == "MatrixVisualization":
@@ -1683,59 +2129,77 @@ class FigureGenerationGUI:
             self.generate_tuning_curve_figure()
         else:
             # Placeholder for other custom modes
+            mode_config = self.MODE_DEFINITIONS[mode]
             self.inspection_ax.text(0.5, 0.5, f"Figure generation for '{mode}' mode\nwill be implemented based on:\n\n{mode_config.get('description', 'No description available')}", 
                                   ha='center', va='center', transform=self.inspection_ax.transAxes,
                                   fontsize=12, alpha=0.7)
     
     def generate_rasterplot_figure(self):
         """Generate RasterPlot visualization."""
+        self._raster_relayout = True
         try:
             # Check if raster matrix is selected
             if 'raster_matrix' not in self.file_selection_widgets or not self.file_selection_widgets['raster_matrix']['var'].get():
+                self.inspection_ax.clear()
                 self.inspection_ax.text(0.5, 0.5, 'Please select a Raster matrix file', 
                                       ha='center', va='center', transform=self.inspection_ax.transAxes,
                                       fontsize=12, alpha=0.7)
                 return
             
-            # Load raster matrix
+            # Resolve the raster matrix and optional label/annotation files
             raster_file = self.file_selection_widgets['raster_matrix']['var'].get()
-            dataset_path = os.path.join("data", "datasets", self.selected_dataset.name)
+            dataset_path = self.get_dataset_path()
             raster_path = os.path.join(dataset_path, raster_file)
             
-            # Load matrix data
-            raster_matrix = np.load(raster_path)
-            
-            # Load row and column labels if available
-            row_labels = None
-            column_labels = None
+            row_labels_path = None
+            column_labels_path = None
+            annotation_path = None
             
             if self.raster_row_labels_enabled.get() and 'row_labels' in self.file_selection_widgets:
                 row_labels_file = self.file_selection_widgets['row_labels']['var'].get()
                 if row_labels_file:
                     row_labels_path = os.path.join(dataset_path, row_labels_file)
-                    row_labels = pd.read_csv(row_labels_path)
             
             if self.raster_column_labels_enabled.get() and 'column_labels' in self.file_selection_widgets:
                 column_labels_file = self.file_selection_widgets['column_labels']['var'].get()
                 if column_labels_file:
                     column_labels_path = os.path.join(dataset_path, column_labels_file)
-                    column_labels = pd.read_csv(column_labels_path)
-            
-            # Apply sorting if enabled
-            raster_matrix, row_labels, column_labels = self.apply_sorting_to_matrix(
-                raster_matrix, row_labels, column_labels)
             
             # Check if annotation is enabled and available
             show_annotation = (self.raster_annotation_enabled.get() and 
                              'annotation' in self.file_selection_widgets and 
                              self.file_selection_widgets['annotation']['var'].get())
+            if show_annotation:
+                annotation_file = self.file_selection_widgets['annotation']['var'].get()
+                annotation_path = os.path.join(dataset_path, annotation_file)
+            
+            # Files not read yet are loaded on a worker thread; the figure is redrawn when they arrive
+            paths = tuple(path for path in (raster_path, row_labels_path, column_labels_path, annotation_path) if path)
+            if not self._raster_files_ready(paths):
+                self.inspection_ax.clear()
+                self.inspection_ax.text(0.5, 0.5, 'Loading raster matrix...', 
+                                      ha='center', va='center', transform=self.inspection_ax.transAxes,
+                                      fontsize=12, alpha=0.7)
+                return
+            
+            raster_matrix = self._raster_files[raster_path]
+            
+            # Color limits depend only on the loaded matrix (sorting doesn't change them), so compute them once
+            if self._raster_clim[0] is not raster_matrix:
+                self._raster_clim = (raster_matrix, np.nanmin(raster_matrix), np.nanmax(raster_matrix))
+            vmin, vmax = self._raster_clim[1:]
+            row_labels = self._raster_files.get(row_labels_path)
+            column_labels = self._raster_files.get(column_labels_path)
+            label_frames = (row_labels, column_labels)
+            
+            # Apply sorting if enabled
+            raster_matrix, row_labels, column_labels = self.apply_sorting_to_matrix(
+                raster_matrix, row_labels, column_labels)
             
             annotation_data = None
             if show_annotation:
                 try:
-                    annotation_file = self.file_selection_widgets['annotation']['var'].get()
-                    annotation_path = os.path.join(dataset_path, annotation_file)
-                    annotation_df = pd.read_csv(annotation_path)
+                    annotation_df = self._raster_files[annotation_path]
                     annotation_data = annotation_df.iloc[:, 0].values  # Get first column as numpy array
                     
                     # Ensure annotation data matches matrix width
@@ -1755,28 +2219,66 @@ class FigureGenerationGUI:
                     show_annotation = False
                     annotation_data = None
             
-            # Clear the figure and create new subplots if needed
-            self.inspection_fig.clear()
+            layout = show_annotation and annotation_data is not None
+            reuse = (self._raster_image is not None and self._raster_layout == layout and
+                     self._raster_image in self.inspection_ax.images)
             
-            if show_annotation and annotation_data is not None:
-                # Create subplots with annotation
-                height_ratios = [self.MODE_DEFINITIONS["RasterPlot"]["controls"]["annotation_height_ratio"], 1.0]
-                gs = self.inspection_fig.add_gridspec(2, 1, height_ratios=height_ratios, hspace=0.02)
+            if reuse:
+                # Same subplot layout: drop leftover text and keep the existing axes and image
+                for text in list(self.inspection_ax.texts):
+                    text.remove()
+                self.inspection_ax.set_title("")
+                if layout:
+                    self._raster_annotation_ax.clear()
+            else:
+                # Clear the figure and create new subplots
+                self.inspection_fig.clear()
+                self._raster_image = None
+                self._raster_annotation_ax = None
+                self._raster_layout = layout
                 
-                # Annotation subplot (top)
-                annotation_ax = self.inspection_fig.add_subplot(gs[0])
+                if layout:
+                    # Create subplots with annotation
+                    height_ratios = [self.MODE_DEFINITIONS["RasterPlot"]["controls"]["annotation_height_ratio"], 1.0]
+                    gs = self.inspection_fig.add_gridspec(2, 1, height_ratios=height_ratios, hspace=0.02)
+                    
+                    # Annotation subplot (top)
+                    self._raster_annotation_ax = self.inspection_fig.add_subplot(gs[0])
+                    
+                    # Main raster plot subplot (bottom)
+                    self.inspection_ax = self.inspection_fig.add_subplot(gs[1])
+                else:
+                    # Single subplot for raster plot only
+                    self.inspection_ax = self.inspection_fig.add_subplot(111)
+            
+            if layout:
                 annotation_name = self.raster_annotation_name.get() or os.path.splitext(os.path.basename(annotation_file))[0]
-                self.render_annotation(annotation_ax, annotation_data, annotation_name)
-                
-                # Main raster plot subplot (bottom)
-                self.inspection_ax = self.inspection_fig.add_subplot(gs[1])
-            else:
-                # Single subplot for raster plot only
-                self.inspection_ax = self.inspection_fig.add_subplot(111)
+                self.render_annotation(self._raster_annotation_ax, annotation_data, annotation_name)
             
-            # Create the main raster plot
+            # Create the main raster plot, reduced to about the axes' pixel size
             colormap = self.raster_colormap.get()
-            im = self.inspection_ax.imshow(raster_matrix, cmap=colormap, aspect='auto')
+            n_rows, n_cols = raster_matrix.shape
+            bbox = self.inspection_ax.bbox
+            display_key = (raster_matrix, int(bbox.height), int(bbox.width))
+            if self._raster_display[0] is not raster_matrix or self._raster_display[1:3] != display_key[1:]:
+                # Reduced again only for a different matrix or axes size
+                self._raster_display = display_key + (_max_downsample(*display_key),)
+            display_matrix = self._raster_display[3]
+            
+            # Keep full-resolution data coordinates and color limits so labels and colors are unchanged
+            extent = (-0.5, n_cols - 0.5, n_rows - 0.5, -0.5)
+            if display_matrix.dtype == np.uint8 and vmin == 0 and vmax == 1:
+                # Binary raster: look the colors up directly instead of normalizing every pixel
+                display_matrix = _binary_lut(colormap)[display_matrix]
+            if self._raster_image is None:
+                self._raster_image = self.inspection_ax.imshow(display_matrix, cmap=colormap, aspect='auto',
+                                                               extent=extent, vmin=vmin, vmax=vmax)
+            else:
+                # Update the existing image instead of building a new one
+                self._raster_image.set_data(display_matrix)
+                self._raster_image.set_cmap(colormap)
+                self._raster_image.set_clim(vmin, vmax)
+                self._raster_image.set_extent(extent)
             
             # Set title
             dataset_name = self.selected_dataset.name
@@ -1801,6 +2303,28 @@ class FigureGenerationGUI:
             self.inspection_ax.set_xlabel(self.raster_column_title.get())
             self.inspection_ax.set_ylabel(self.raster_row_title.get())
             
+            # A new raster is drawn, so any saved blit background is stale
+            self._raster_bg = None
+            self._raster_titles_ax = self.inspection_ax
+            
+            # The reused axes still carry the previous ticks; redo ticks and layout only if their inputs changed
+            tick_key = (self.raster_row_labels_enabled.get(), self.raster_row_label_count.get(),
+                        self.raster_column_labels_enabled.get(), self.raster_column_label_count.get(),
+                        self.sorting_state(), raster_file, raster_matrix.shape)
+            layout_key = (layout, figure_title, self.inspection_title_var.get(),
+                          self.raster_column_title.get(), self.raster_row_title.get(), tick_key)
+            ticks_unchanged = (reuse and tick_key == self._raster_tick_key and
+                               self._raster_label_frames[0] is label_frames[0] and
+                               self._raster_label_frames[1] is label_frames[1])
+            if ticks_unchanged:
+                # Only titles may have changed, which needs a new layout but not new ticks
+                self._raster_relayout = layout_key != self._raster_layout_key
+                self._raster_layout_key = layout_key
+                return
+            self._raster_tick_key = tick_key
+            self._raster_layout_key = layout_key
+            self._raster_label_frames = label_frames
+            
             # Handle row labels
             if self.raster_row_labels_enabled.get() and row_labels is not None:
                 self.apply_sorted_axis_labels(row_labels, 'row', raster_matrix.shape[0])
@@ -1815,21 +2339,75 @@ class FigureGenerationGUI:
                 # Clear column labels if no file selected or checkbox unchecked
                 self.inspection_ax.set_xticks([])
             
-            # Remove any existing colorbar
-            if hasattr(self, 'raster_colorbar') and self.raster_colorbar is not None:
-                try:
-                    self.raster_colorbar.remove()
-                except (ValueError, AttributeError):
-                    # Colorbar might already be removed or invalid
-                    pass
-                self.raster_colorbar = None
-            
         except Exception as e:
+            self.inspection_ax.clear()
+            self._raster_image = None
             self.inspection_ax.text(0.5, 0.5, f'Error generating RasterPlot:\n{str(e)}', 
                                   ha='center', va='center', transform=self.inspection_ax.transAxes,
                                   fontsize=10, color='red')
             print(f"RasterPlot error: {e}")
     
+    def _raster_files_ready(self, paths):
+        """Return True if all paths are loaded, otherwise start loading the missing ones."""
+        missing = [path for path in paths if path not in self._raster_files]
+        if not missing:
+            return True
+        
+        # Only one load per set of files is in flight at a time
+        if self._raster_files_request != paths:
+            self._raster_files_request = paths
+            self._run_in_background(self._load_raster_files_worker, paths, missing)
+        return False
+    
+    def _load_raster_files_worker(self, paths, missing):
+        """Read raster matrix (.npy) and label/annotation (.csv) files (worker thread)."""
+        def read(path):
+            # Raster matrices are memory-mapped and cached; binary spike rasters are kept as uint8
+            if path.endswith('.npy'):
+                return _load_matrix(path, compact=(path == paths[0]))
+            return self._read_labels(path)
+        
+        # The files are independent, so read them concurrently
+        with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+            futures = {path: pool.submit(read, path) for path in missing}
+        
+        loaded = {}
+        error = None
+        for path, future in futures.items():
+            try:
+                loaded[path] = future.result()
+            except Exception as e:
+                # The raster matrix is required; unreadable label/annotation files are skipped
+                if path == paths[0]:
+                    error = e
+                    break
+                print(f"Error loading {path}: {e}")
+                loaded[path] = None
+        self._ui_queue.put((self._on_raster_files_loaded, (paths, loaded, error)))
+    
+    def _on_raster_files_loaded(self, payload):
+        """Store files read by _load_raster_files_worker and redraw the figure."""
+        paths, loaded, error = payload
+        if paths != self._raster_files_request:
+            return
+        self._raster_files_request = None
+        
+        if error is not None:
+            self.inspection_ax.clear()
+            self.inspection_ax.text(0.5, 0.5, f'Error generating RasterPlot:\n{str(error)}', 
+                                  ha='center', va='center', transform=self.inspection_ax.transAxes,
+                                  fontsize=10, color='red')
+            self.figure_canvas.draw_idle()
+            print(f"RasterPlot error: {error}")
+            return
+        
+        # Keep only the files the current figure uses
+        files = {path: self._raster_files[path] for path in paths if path in self._raster_files}
+        files.update(loaded)
+        self._raster_files = files
+        
+        self.update_inspection_figure()
+    
     def generate_matrix_visualization_figure(self):
         """Generate MatrixVisualization visualization."""
         try:
@@ -1842,11 +2420,11 @@ class FigureGenerationGUI:
             
             # Load matrix
             matrix_file = self.file_selection_widgets['matrix']['var'].get()
-            dataset_path = os.path.join("data", "datasets", self.selected_dataset.name)
+            dataset_path = self.get_dataset_path()
             matrix_path = os.path.join(dataset_path, matrix_file)
             
             # Load matrix data
-            matrix_data = np.load(matrix_path)
+            matrix_data = _load_matrix(matrix_path)
             
             # Check if matrix is 2D
             if matrix_data.ndim != 2:
@@ -1862,9 +2440,8 @@ class FigureGenerationGUI:
             # Apply sorting if enabled
             matrix_data, _, _ = self.apply_sorting_to_matrix(matrix_data, None, None)
             
-            # Clear the figure
-            self.inspection_fig.clear()
-            self.inspection_ax = self.inspection_fig.add_subplot(111)
+            # Single plot layout
+            self.use_single_inspection_axes()
             
             # Create the matrix visualization
             colormap = self.matrix_colormap.get()
@@ -1931,6 +2508,14 @@ class FigureGenerationGUI:
                                   fontsize=10, color='red')
             print(f"MatrixVisualization error: {e}")
     
+    def use_single_inspection_axes(self):
+        """Leave the inspection figure with one cleared axes, reusing it when the layout already matches."""
+        if self.inspection_fig.axes == [self.inspection_ax]:
+            self.inspection_ax.clear()
+        else:
+            self.inspection_fig.clear()
+            self.inspection_ax = self.inspection_fig.add_subplot(111)
+    
     def generate_tuning_curve_figure(self):
         """Generate Tuning Curve visualization."""
         try:
@@ -1947,15 +2532,15 @@ class FigureGenerationGUI:
             
             # Load raster matrix
             raster_file = self.file_selection_widgets['raster_matrix']['var'].get()
-            dataset_path = os.path.join("data", "datasets", self.selected_dataset.name)
+            dataset_path = self.get_dataset_path()
             raster_path = os.path.join(dataset_path, raster_file)
-            raster_matrix = np.load(raster_path)
+            raster_matrix = _load_matrix(raster_path)
             self.current_raster_data = raster_matrix  # Store for navigation
             
             # Load annotation data
             annotation_file = self.file_selection_widgets['annotation']['var'].get()
             annotation_path = os.path.join(dataset_path, annotation_file)
-            annotation_df = pd.read_csv(annotation_path)
+            annotation_df = self._read_labels(annotation_path)
             annotation_data = annotation_df.iloc[:, 0].values
             
             # Get parameters
@@ -2180,8 +2765,7 @@ class FigureGenerationGUI:
             
         except Exception as e:
             # Clear figure and show error
-            self.inspection_fig.clear()
-            self.inspection_ax = self.inspection_fig.add_subplot(111)
+            self.use_single_inspection_axes()
             self.inspection_ax.text(0.5, 0.5, f'Error generating Tuning Curve:\n{str(e)}', 
                                   ha='center', va='center', transform=self.inspection_ax.transAxes,
                                   fontsize=10, color='red')
@@ -2328,51 +2912,46 @@ class FigureGenerationGUI:
                              ha='center', va='center', transform=annotation_ax.transAxes,
                              fontsize=8, color='red')
     
+    def equally_spaced_labels(self, raw_labels, axis):
+        """Pick equally spaced tick positions and their formatted labels."""
+        # Get the number of labels to show
+        count_var = self.raster_row_label_count if axis == 'row' else self.raster_column_label_count
+        try:
+            num_labels = int(count_var.get())
+        except ValueError:
+            num_labels = 6
+        
+        n = len(raw_labels)
+        if n == 0 or num_labels <= 0:
+            return np.empty(0, dtype=np.intp), []
+        
+        # Calculate equally spaced positions
+        max_labels = min(num_labels, n)
+        if max_labels == 1:
+            positions = np.array([n - 1], dtype=np.intp)
+        else:
+            positions = np.rint(np.linspace(0, n - 1, max_labels)).astype(np.intp)
+        
+        # Format only the selected labels: numbers are rounded to integers, anything else is kept as a string
+        selected_labels = []
+        for label in np.asarray(raw_labels, dtype=object)[positions]:
+            try:
+                selected_labels.append(str(int(round(float(label)))))
+            except (ValueError, TypeError):
+                selected_labels.append(str(label).strip())
+        return positions, selected_labels
+    
     def apply_axis_labels(self, raster_path, labels_file, axis, axis_length):
         """Apply labels to the specified axis with equal spacing."""
         try:
-            dataset_path = os.path.join("data", "datasets", self.selected_dataset.name)
+            dataset_path = self.get_dataset_path()
             labels_path = os.path.join(dataset_path, labels_file)
             
             # Load labels
-            labels_df = pd.read_csv(labels_path)
+            labels_df = self._read_labels(labels_path)
             # Assume first column contains the labels
-            # Format numeric labels by rounding to integers, keep non-numeric as strings
-            raw_labels = labels_df.iloc[:, 0]
-            labels = []
-            for label in raw_labels:
-                try:
-                    # Try to convert to float first
-                    float_val = float(label)
-                    # Round to nearest integer for display
-                    labels.append(str(int(round(float_val))))
-                except (ValueError, TypeError):
-                    # If conversion fails, keep as string (strip whitespace)
-                    labels.append(str(label).strip())
-            
-            # Get the number of labels to show
-            if axis == 'row':
-                try:
-                    num_labels = int(self.raster_row_label_count.get())
-                except ValueError:
-                    num_labels = 6
-            else:
-                try:
-                    num_labels = int(self.raster_column_label_count.get())
-                except ValueError:
-                    num_labels = 6
-            
-            # Calculate equally spaced positions
-            if len(labels) > 0 and num_labels > 0:
-                max_labels = min(num_labels, len(labels))
-                if max_labels == 1:
-                    positions = [len(labels) - 1]
-                    selected_labels = [labels[-1]]
-                else:
-                    step = (len(labels) - 1) / (max_labels - 1)
-                    positions = [int(round(i * step)) for i in range(max_labels)]
-                    selected_labels = [labels[pos] for pos in positions]
-                
+            positions, selected_labels = self.equally_spaced_labels(labels_df.iloc[:, 0], axis)
+            if len(positions) > 0:
                 # Apply to appropriate axis
                 if axis == 'row':
                     self.inspection_ax.set_yticks(positions)
@@ -2393,42 +2972,8 @@ class FigureGenerationGUI:
         """Apply labels to the specified axis using pre-sorted labels DataFrame."""
         try:
             # Assume first column contains the labels
-            # Format numeric labels by rounding to integers, keep non-numeric as strings
-            raw_labels = labels_df.iloc[:, 0]
-            labels = []
-            for label in raw_labels:
-                try:
-                    # Try to convert to float first
-                    float_val = float(label)
-                    # Round to nearest integer for display
-                    labels.append(str(int(round(float_val))))
-                except (ValueError, TypeError):
-                    # If conversion fails, keep as string (strip whitespace)
-                    labels.append(str(label).strip())
-            
-            # Get the number of labels to show
-            if axis == 'row':
-                try:
-                    num_labels = int(self.raster_row_label_count.get())
-                except ValueError:
-                    num_labels = 6
-            else:
-                try:
-                    num_labels = int(self.raster_column_label_count.get())
-                except ValueError:
-                    num_labels = 6
-            
-            # Calculate equally spaced positions
-            if len(labels) > 0 and num_labels > 0:
-                max_labels = min(num_labels, len(labels))
-                if max_labels == 1:
-                    positions = [len(labels) - 1]
-                    selected_labels = [labels[-1]]
-                else:
-                    step = (len(labels) - 1) / (max_labels - 1)
-                    positions = [int(round(i * step)) for i in range(max_labels)]
-                    selected_labels = [labels[pos] for pos in positions]
-                
+            positions, selected_labels = self.equally_spaced_labels(labels_df.iloc[:, 0], axis)
+            if len(positions) > 0:
                 # Apply to appropriate axis
                 if axis == 'row':
                     self.inspection_ax.set_yticks(positions)
@@ -2452,7 +2997,7 @@ class FigureGenerationGUI:
             self.inspection_ax.text(0.5, 0.5, 'Select dataset, file, and mode to display figure', 
                                   ha='center', va='center', transform=self.inspection_ax.transAxes,
                                   fontsize=12, alpha=0.7)
-            self.figure_canvas.draw()
+            self.figure_canvas.draw_idle()
     
     def reset_inspection_view(self):
         """Reset the inspection view to default state."""
@@ -2467,6 +3012,10 @@ class FigureGenerationGUI:
         self.selected_files = {}
         self.current_data = None
         self.available_files = []
+        self._raster_files = {}
+        self._raster_image = None
+        self._raster_clim = (None, None, None)
+        self._raster_display = (None, None, None, None)
         
         # Clear controls
         self.inspection_mode_combo['values'] = []
@@ -2483,11 +3032,20 @@ class FigureGenerationGUI:
     
     def refresh_inspection_data(self):
         """Refresh the data and regenerate the figure."""
-        if self.selected_dataset and self.inspection_mode_var.get():
+        mode = self.inspection_mode_var.get()
+        if self.selected_dataset and mode:
+            # Drop files read for the previous figure and the file list so they are re-read from disk
+            self._raster_files = {}
+            self._raster_clim = (None, None, None)
+            self._raster_display = (None, None, None, None)
+            self._label_cache.clear()
+            _load_matrix_file.cache_clear()
+            self._files_cache.pop(self.selected_dataset.name, None)
+            
             # Reload dataset files
             self.load_dataset_files()
             # Recreate required files widgets
-            self.create_required_files_widgets(self.inspection_mode_var.get())
+            self.create_required_files_widgets(mode)
             # Clear figure
             self.clear_inspection_figure()
         else:
@@ -2495,23 +3053,25 @@ class FigureGenerationGUI:
     
     def save_inspection_figure(self):
         """Save the current inspection figure."""
-        if not self.selected_dataset or not self.inspection_mode_var.get() or not hasattr(self, 'selected_files') or not self.selected_files:
+        mode = self.inspection_mode_var.get()
+        if not self.selected_dataset or not mode or not hasattr(self, 'selected_files') or not self.selected_files:
             messagebox.showwarning("Incomplete Selection", 
                                  "Please select dataset, mode, and required files before saving.")
             return
         
         try:
             # Create mode-specific filename
-            mode_name = self.inspection_mode_var.get().replace(" ", "_").lower()
-            # Use first selected file for filename base
-            first_file = list(self.selected_files.values())[0]
+            mode_name = mode.replace(" ", "_").lower()
+            # Use first selected file (in widget order) for filename base
+            first_file = next(self.selected_files[name] for name in self.file_selection_widgets
+                              if name in self.selected_files)
             file_base = os.path.splitext(os.path.basename(first_file))[0]
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
             filename = f"inspection_{mode_name}_{file_base}_{timestamp}.{self.inspection_format_var.get()}"
             
             # Create figures directory
-            figures_dir = os.path.join("data", "datasets", self.selected_dataset.name, "figures")
+            figures_dir = os.path.join(self.get_dataset_path(), "figures")
             os.makedirs(figures_dir, exist_ok=True)
             filepath = os.path.join(figures_dir, filename)
             
@@ -2521,7 +3081,7 @@ class FigureGenerationGUI:
             
             # Collect parameters
             parameters = {
-                "mode": self.inspection_mode_var.get(),
+                "mode": mode,
                 "selected_files": self.selected_files,
                 "timestamp": timestamp
             }
@@ -2534,11 +3094,13 @@ class FigureGenerationGUI:
                 FigureOperations.create_figure(
                     figure_name=filename,
                     figure_path=filepath,
-                    figure_type=f"Inspection - {self.inspection_mode_var.get()}",
+                    figure_type=f"Inspection - {mode}",
                     dataset_id=self.selected_dataset.id,
                     parameters=parameters,
-                    description=f"Figure inspection: {self.inspection_mode_var.get()} analysis using {len(self.selected_files)} file(s)"
+                    description=f"Figure inspection: {mode} analysis using {len(self.selected_files)} file(s)"
                 )
+                # Refresh figures list the next time the browse tab is shown
+                self._browse_dirty = True
             except Exception as db_error:
                 print(f"Database error (figure still saved): {db_error}")
             
@@ -2549,10 +3111,12 @@ class FigureGenerationGUI:
     
     def create_default_plot_params(self):
         """Create default plot parameter widgets."""
-        # Clear existing widgets
+        # Hide existing widgets; they are reused below
         for widget in self.params_container.winfo_children():
-            widget.destroy()
-        self.param_widgets.clear()
+            widget.grid_forget()
+        self._param_keys.clear()
+        self._param_vars.clear()
+        self._param_is_bool.clear()
         
         # Default parameters
         params = [
@@ -2565,58 +3129,185 @@ class FigureGenerationGUI:
             ("figsize_height", "Figure Height (inches):", "6", "float")
         ]
         
+        used = {'label': 0, 'entry': 0, 'check': 0}
         for i, (key, label, default, param_type) in enumerate(params):
             row = i // 2
             col = (i % 2) * 2
             
-            ttk.Label(self.params_container, text=label).grid(row=row, column=col, sticky="w", padx=5, pady=2)
+            label_widget = self._take_param_widget('label', used)
+            label_widget.configure(text=label)
+            label_widget.grid(row=row, column=col, sticky="w", padx=5, pady=2)
             
-            if param_type == "bool":
-                self.param_widgets[key] = tk.BooleanVar(value=default)
-                ttk.Checkbutton(self.params_container, variable=self.param_widgets[key]).grid(
-                    row=row, column=col+1, sticky="w", padx=5, pady=2)
+            is_bool = param_type == "bool"
+            if is_bool:
+                var = tk.BooleanVar(value=default)
+                check = self._take_param_widget('check', used)
+                check.configure(variable=var)
+                check.grid(row=row, column=col+1, sticky="w", padx=5, pady=2)
+            else:
+                var = tk.StringVar(value=str(default))
+                entry = self._take_param_widget('entry', used)
+                entry.configure(textvariable=var)
+                entry.grid(row=row, column=col+1, padx=5, pady=2)
+            
+            self._param_keys.append(key)
+            self._param_vars.append(var)
+            self._param_is_bool.append(is_bool)
+    
+    def _take_param_widget(self, kind, used):
+        """Return the next unused pooled parameter widget of a kind, creating it if the pool is exhausted."""
+        pool = self._param_widget_pool[kind]
+        if used[kind] == len(pool):
+            if kind == 'label':
+                pool.append(ttk.Label(self.params_container))
+            elif kind == 'entry':
+                pool.append(ttk.Entry(self.params_container, width=20))
             else:
-                self.param_widgets[key] = tk.StringVar(value=str(default))
-                ttk.Entry(self.params_container, textvariable=self.param_widgets[key], 
-                         width=20).grid(row=row, column=col+1, padx=5, pady=2)
+                pool.append(ttk.Checkbutton(self.params_container))
+        
+        widget = pool[used[kind]]
+        used[kind] += 1
+        return widget
+    
+    def _get_datasets(self):
+        """Get the dataset list, re-querying at most every DATASETS_CACHE_TTL seconds."""
+        now = time.monotonic()
+        if self._datasets_cache is None or now - self._datasets_cache_ts > self.DATASETS_CACHE_TTL:
+            self._datasets_cache = DatasetOperations.list_datasets()
+            self._datasets_cache_ts = now
+        return self._datasets_cache
     
     def load_datasets(self):
         """Load available datasets."""
         try:
-            datasets = DatasetOperations.list_datasets()
-            dataset_names = [f"{dataset.name} (ID: {dataset.id})" for dataset in datasets]
-            
-            self.dataset_combo['values'] = dataset_names
+            self._set_dataset_choices(self._get_datasets())
             self.filter_dataset_var.set("")  # Clear filter
-            
-            # Store dataset objects for reference
-            self.dataset_objects = {f"{dataset.name} (ID: {dataset.id})": dataset 
-                                   for dataset in datasets}
+            self._datasets_loaded = True
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load datasets: {str(e)}")
     
+    def _ensure_datasets_loaded(self, event=None):
+        """Load the dataset list the first time the dataset dropdown is used."""
+        if not self._datasets_loaded:
+            self.load_datasets()
+    
+    def _set_dataset_choices(self, datasets):
+        """Show the given datasets in the dataset combobox."""
+        # Build the display names and the dataset lookup in one pass
+        dataset_objects = {}
+        for dataset in datasets:
+            dataset_objects[f"{dataset.name} (ID: {dataset.id})"] = dataset
+        
+        self.dataset_combo['values'] = tuple(dataset_objects)
+        
+        # Store dataset objects for reference
+        self.dataset_objects = dataset_objects
+    
+    def on_dataset_filter_key(self, event=None):
+        """Narrow the dataset dropdown to datasets matching the typed text."""
+        if event is not None and event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        
+        search_text = self.dataset_combo_var.get().strip()
+        try:
+            if search_text:
+                datasets = DatasetOperations.search_datasets(search_text, limit=self.DATASET_FILTER_LIMIT)
+            else:
+                datasets = self._get_datasets()
+            self._set_dataset_choices(datasets)
+        except Exception as e:
+            print(f"Error filtering datasets: {e}")
+    
+    def _run_in_background(self, worker, *args, executor=None):
+        """Run worker(*args) off the Tk thread; it reports back through the UI queue.
+        
+        Without an executor the worker gets its own daemon thread.
+        """
+        self._ui_workers += 1
+        if executor is None:
+            threading.Thread(target=self._background_worker, args=(worker,) + args, daemon=True).start()
+        else:
+            executor.submit(self._background_worker, worker, *args)
+        self._schedule_ui_drain()
+    
+    def _background_worker(self, worker, *args):
+        """Thread target: run a worker and always signal completion."""
+        try:
+            worker(*args)
+        finally:
+            self._ui_queue.put((self._on_worker_finished, None))
+    
+    def _on_worker_finished(self, payload):
+        """Account for a finished background worker."""
+        self._ui_workers -= 1
+    
+    def _schedule_ui_drain(self):
+        """Schedule a drain of the UI queue unless one is already pending."""
+        if not self._ui_drain_scheduled:
+            self._ui_drain_scheduled = True
+            self.window.after(self.UI_QUEUE_POLL_MS, self._drain_ui_queue)
+    
+    def _drain_ui_queue(self):
+        """Apply queued background results on the Tk main thread."""
+        self._ui_drain_scheduled = False
+        for _ in range(self.UI_QUEUE_MAX_ITEMS):
+            try:
+                handler, payload = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                handler(payload)
+            except Exception as e:
+                print(f"Error applying background result: {e}")
+        
+        # Keep polling while workers are running or results are still queued
+        if self._ui_workers or not self._ui_queue.empty():
+            self._schedule_ui_drain()
+    
     def on_dataset_select(self, event=None):
         """Handle dataset selection."""
         selected = self.dataset_combo_var.get()
         if selected and selected in self.dataset_objects:
             self.selected_dataset = self.dataset_objects[selected]
             
-            # Load processing jobs for this dataset
-            try:
+            # Only query jobs once the selection stops changing
+            if self._job_load_after is not None:
+                self.window.after_cancel(self._job_load_after)
+            self._job_load_after = self.window.after(self.JOBS_LOAD_DELAY_MS, self._really_load_jobs)
+    
+    def _really_load_jobs(self):
+        """Load processing jobs for the selected dataset."""
+        self._job_load_after = None
+        if not self.selected_dataset:
+            return
+        
+        # Load processing jobs for this dataset
+        try:
+            now = time.monotonic()
+            cached = self._jobs_cache.pop(self.selected_dataset.id, None)
+            if cached and now - cached[0] < self.JOBS_CACHE_TTL:
+                job_names = cached[1]
+            else:
                 jobs = ProcessingJobOperations.list_jobs_for_dataset(self.selected_dataset.id)
                 job_names = [f"{job.job_name} (ID: {job.id})" for job in jobs if job.status == 'completed']
                 job_names.insert(0, "None - Use raw data")
+                cached = (now, job_names)
+            
+            # Re-inserted entries move to the end; evict the least recently used once full
+            if len(self._jobs_cache) >= self.JOBS_CACHE_SIZE:
+                del self._jobs_cache[next(iter(self._jobs_cache))]
+            self._jobs_cache[self.selected_dataset.id] = cached
+            
+            self.job_combo['values'] = job_names
+            self.job_combo_var.set("None - Use raw data")
+            
+            # Auto-fill figure name
+            if not self.figure_name_var.get():
+                self.figure_name_var.set(f"Figure_{self.selected_dataset.name}")
                 
-                self.job_combo['values'] = job_names
-                self.job_combo_var.set("None - Use raw data")
-                
-                # Auto-fill figure name
-                if not self.figure_name_var.get():
-                    self.figure_name_var.set(f"Figure_{self.selected_dataset.name}")
-                    
-            except Exception as e:
-                print(f"Error loading jobs: {e}")
+        except Exception as e:
+            print(f"Error loading jobs: {e}")
     
     def on_figure_type_change(self, event=None):
         """Update parameters based on figure type."""
@@ -2650,22 +3341,24 @@ class FigureGenerationGUI:
         preview_text = tk.Text(preview_window, wrap=tk.WORD)
         preview_text.pack(fill="both", expand=True, padx=10, pady=10)
         
-        preview_content = f"Figure Preview:\\n\\n"
-        preview_content += f"Dataset: {self.selected_dataset.name}\\n"
-        preview_content += f"Figure Type: {self.figure_type_var.get()}\\n"
-        preview_content += f"Figure Name: {self.figure_name_var.get()}\\n"
-        preview_content += f"Output Format: {self.output_format_var.get()}\\n"
-        preview_content += f"DPI: {self.dpi_var.get()}\\n\\n"
-        
-        preview_content += "Parameters:\\n"
-        for key, widget in self.param_widgets.items():
-            if isinstance(widget, tk.BooleanVar):
-                preview_content += f"  {key}: {widget.get()}\\n"
-            else:
-                preview_content += f"  {key}: {widget.get()}\\n"
+        lines = [
+            "Figure Preview:",
+            "",
+            f"Dataset: {self.selected_dataset.name}",
+            f"Figure Type: {self.figure_type_var.get()}",
+            f"Figure Name: {self.figure_name_var.get()}",
+            f"Output Format: {self.output_format_var.get()}",
+            f"DPI: {self.dpi_var.get()}",
+            "",
+            "Parameters:"
+        ]
+        for key, var in zip(self._param_keys, self._param_vars):
+            lines.append(f"  {key}: {var.get()}")
         
-        preview_content += "\\n[Actual figure preview would be displayed here]"
+        lines.append("")
+        lines.append("[Actual figure preview would be displayed here]")
         
+        preview_content = "\n".join(lines)
         preview_text.insert(tk.END, preview_content)
         preview_text.config(state=tk.DISABLED)
     
@@ -2686,99 +3379,300 @@ class FigureGenerationGUI:
         
         try:
             # Collect parameters
-            parameters = {}
-            for key, widget in self.param_widgets.items():
-                if isinstance(widget, tk.BooleanVar):
-                    parameters[key] = widget.get()
-                else:
-                    parameters[key] = widget.get()
+            parameters = {key: var.get() for key, var in zip(self._param_keys, self._param_vars)}
             
             # Create output path
-            output_dir = "data/figures"
-            os.makedirs(output_dir, exist_ok=True)
+            figure_path = os.path.join(self.FIGURES_DIR, f"{figure_name}.{self.output_format_var.get()}")
             
-            figure_filename = f"{figure_name}.{self.output_format_var.get()}"
-            figure_path = os.path.join(output_dir, figure_filename)
-            
-            # Here you would implement the actual figure generation
-            # For now, we'll create a placeholder file and database record
-            
-            # Create placeholder file
-            with open(figure_path, 'w') as f:
-                f.write(f"Placeholder for {figure_name}\\n")
-                f.write(f"Dataset: {self.selected_dataset.name}\\n")
-                f.write(f"Type: {self.figure_type_var.get()}\\n")
-            
-            # Create database record
-            figure_id = FigureOperations.create_figure(
-                figure_name=figure_name,
-                figure_path=figure_path,
-                figure_type=self.figure_type_var.get(),
-                dataset_id=self.selected_dataset.id,
-                parameters=parameters,
-                description=f"Generated {self.figure_type_var.get()} for {self.selected_dataset.name}"
-            )
-            
-            messagebox.showinfo("Success", f"Figure '{figure_name}' generated successfully!\\nSaved to: {figure_path}")
-            
-            # Refresh figures list if on browse tab
-            self.load_figures()
+            # Write the file and database record on the I/O pool
+            future = self._io_pool.submit(self._do_generate, figure_name, figure_path,
+                                          self.figure_type_var.get(), self.selected_dataset, parameters)
+            self.window.after(self.GENERATE_POLL_MS, self._check_future, future)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate figure: {str(e)}")
     
+    def _do_generate(self, figure_name, figure_path, figure_type, dataset, parameters):
+        """Write the figure file and its database record (I/O pool thread)."""
+        if not self._figures_dir_ready:
+            os.makedirs(self.FIGURES_DIR, exist_ok=True)
+            self._figures_dir_ready = True
+        
+        # Here you would implement the actual figure generation
+        # For now, we'll create a placeholder file and database record
+        
+        # Create placeholder file, encoded in memory and written in one raw call
+        placeholder = (f"Placeholder for {figure_name}\\n"
+                       f"Dataset: {dataset.name}\\n"
+                       f"Type: {figure_type}\\n").encode('utf-8')
+        with open(figure_path, 'wb') as f:
+            f.write(placeholder)
+        
+        # Create database record
+        FigureOperations.create_figure(
+            figure_name=figure_name,
+            figure_path=figure_path,
+            figure_type=figure_type,
+            dataset_id=dataset.id,
+            parameters=parameters,
+            description=f"Generated {figure_type} for {dataset.name}"
+        )
+        
+        return figure_name, figure_path
+    
+    def _on_window_destroy(self, event):
+        """Shut the worker pools down once the window itself is destroyed."""
+        if event.widget is not self.window:
+            return
+        
+        self._closed = True
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._db_pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _check_future(self, future):
+        """Report a background figure generation once it has finished."""
+        if self._closed:
+            return
+        
+        if not future.done():
+            self.window.after(self.GENERATE_POLL_MS, self._check_future, future)
+            return
+        
+        try:
+            figure_name, figure_path = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to generate figure: {str(e)}")
+            return
+        
+        messagebox.showinfo("Success", f"Figure '{figure_name}' generated successfully!\\nSaved to: {figure_path}")
+        
+        # Refresh figures list the next time the browse tab is shown
+        self._browse_dirty = True
+        
+        # Dataset list may have changed since it was cached
+        self._datasets_cache = None
+    
     def batch_generate(self):
         """Generate figures for multiple datasets."""
         messagebox.showinfo("Coming Soon", "Batch figure generation will be implemented soon!")
     
-    def load_figures(self):
-        """Load all figures into the browse tree."""
+    def _on_tab_changed(self, event=None):
+        """Fill lazily loaded tabs when they are shown."""
+        selected = self.notebook.select()
+        
+        # Load the figures list when the Browse tab is shown and its contents are stale
+        if self._browse_dirty and selected == str(self._browse_tab):
+            self.load_figures()
+        
+        # Build the Figure Inspection tab (and import matplotlib) on first view
+        elif self._inspection_frame is not None and selected == str(self._inspection_tab):
+            self.build_inspection_tab()
+    
+    def load_figures(self, force=False):
+        """Reload the browse tree, starting with the first page of figures."""
         try:
-            # Clear existing items
-            for item in self.figures_tree.get_children():
-                self.figures_tree.delete(item)
-            
-            # Get all datasets for reference
-            datasets = {dataset.id: dataset.name for dataset in DatasetOperations.list_datasets()}
-            
-            # Get all figures
-            all_figures_query = """
-                SELECT f.*, d.name as dataset_name 
-                FROM figures f
-                LEFT JOIN datasets d ON f.dataset_id = d.id
-                ORDER BY f.creation_date DESC
-            """
-            
-            from src.database.connection import get_database
-            db = get_database()
-            results = db.execute_query(all_figures_query)
-            
-            for result in results:
-                figure_name = result[3]  # figure_name
-                dataset_name = result[-1] or f"Dataset {result[2]}"  # dataset_name or fallback
-                figure_type = result[5] or "Unknown"  # figure_type
-                creation_date = result[6] or ""  # creation_date
-                figure_path = result[4]  # figure_path
-                
-                # Format creation date
-                if creation_date:
-                    try:
-                        from datetime import datetime
-                        dt = datetime.fromisoformat(creation_date)
-                        creation_date = dt.strftime("%Y-%m-%d %H:%M")
-                    except:
-                        pass
-                
-                self.figures_tree.insert("", "end", text=figure_name,
-                                        values=(dataset_name, figure_type, creation_date, figure_path))
+            if force:
+                # Clear existing items in a single delete call
+                self.figures_tree.delete(*self.figures_tree.get_children())
+                self._row_ids.clear()
+                self._row_paths.clear()
+                self._row_texts.clear()
+                self._row_values.clear()
+                self._view_start = 0
+            
+            # Otherwise the current rows stay until the refreshed page overwrites them
+            self._next_row_index = 0
+            
+            # Results still in flight for the previous load are discarded
+            self._figures_generation += 1
+            self._loaded_figure_count = 0
+            self._all_figures_loaded = False
+            self._figures_loading = False
+            self._browse_dirty = False
+            self.load_more_figures()
                 
         except Exception as e:
             print(f"Error loading figures: {e}")
     
+    def load_more_figures(self):
+        """Fetch the next page of figures on the database thread."""
+        if self._all_figures_loaded or self._figures_loading:
+            return
+        
+        self._figures_loading = True
+        self._run_in_background(self._fetch_figures_worker, self._figures_generation,
+                                self._figure_filters, self._loaded_figure_count,
+                                executor=self._db_pool)
+    
+    def _fetch_figures_worker(self, generation, filters, offset):
+        """Query one page of figures and queue it for insertion (database thread)."""
+        try:
+            # Always on _db_pool's thread: sqlite3 caches compiled statements per connection,
+            # and connections are per thread, so this keeps the figures_page plan warm
+            results = self._db.execute_prepared('figures_page',
+                                                filters + (self.FIGURES_PAGE_SIZE, offset))
+        except Exception as e:
+            print(f"Error loading figures: {e}")
+            results = []
+        
+        for start in range(0, len(results), self.UI_QUEUE_BATCH_SIZE):
+            batch = results[start:start + self.UI_QUEUE_BATCH_SIZE]
+            self._ui_queue.put((self._insert_figure_rows, (generation, batch)))
+        self._ui_queue.put((self._finish_figures_page, (generation, len(results))))
+    
+    def _insert_figure_rows(self, payload):
+        """Insert a batch of fetched figure rows into the browse tree."""
+        generation, rows = payload
+        if generation != self._figures_generation:
+            return
+        
+        tree = self.figures_tree
+        for figure_id, figure_name, dataset_name, figure_type, creation_date, figure_path in rows:
+            row_values = (dataset_name, figure_type, creation_date, figure_path)
+            index = self._next_row_index
+            self._next_row_index += 1
+            
+            if index < len(self._row_ids):
+                # Refreshing over a loaded row: only rows that changed touch the tree
+                if (self._row_ids[index] == figure_id and self._row_texts[index] == figure_name
+                        and self._row_values[index] == row_values):
+                    continue
+                self._row_ids[index] = figure_id
+                self._row_paths[index] = figure_path
+                self._row_texts[index] = figure_name
+                self._row_values[index] = row_values
+                if tree.exists(str(index)):
+                    tree.item(str(index), text=figure_name, values=row_values)
+            else:
+                self._row_ids.append(figure_id)
+                self._row_paths.append(figure_path)
+                self._row_texts.append(figure_name)
+                self._row_values.append(row_values)
+        
+        self._render_figures_window()
+    
+    def _render_figures_window(self):
+        """Make the tree hold exactly the loaded rows in the current window."""
+        total = len(self._row_texts)
+        start = max(0, min(self._view_start, total - self.FIGURES_WINDOW_ROWS))
+        end = min(total, start + self.FIGURES_WINDOW_ROWS)
+        self._view_start = start
+        
+        # Detach the scrollbar while populating so it is not updated once per row
+        tree = self.figures_tree
+        tree.configure(yscrollcommand="")
+        try:
+            # Drop rows that scrolled out of the window
+            realized = set()
+            stale = []
+            for iid in tree.get_children():
+                if start <= int(iid) < end:
+                    realized.add(int(iid))
+                else:
+                    stale.append(iid)
+            if stale:
+                tree.delete(*stale)
+            
+            # Children stay sorted by index, so each missing row goes at its offset in the window
+            insert = tree.insert
+            texts = self._row_texts
+            values = self._row_values
+            for index in range(start, end):
+                if index not in realized:
+                    insert("", index - start, iid=str(index), text=texts[index], values=values[index])
+        finally:
+            tree.configure(yscrollcommand=self.on_figures_scroll)
+    
+    def _virtual_yview(self, *args):
+        """Scrollbar command: scroll across all loaded figures, not just the realized rows."""
+        total = len(self._row_texts)
+        if not total:
+            return
+        
+        if args[0] == "moveto":
+            # Re-center the window on the requested row, then scroll the tree to it
+            top = min(int(float(args[1]) * total), total - 1)
+            window = min(total, self.FIGURES_WINDOW_ROWS)
+            self._view_start = top - window // 4
+            self._render_figures_window()
+            self.figures_tree.yview_moveto((top - self._view_start) / window)
+        else:
+            # Unit/page scrolling moves within the window; on_figures_scroll shifts it when needed
+            self.figures_tree.yview(*args)
+
+    def _finish_figures_page(self, payload):
+        """Record that a page of figures has been fully inserted."""
+        generation, row_count = payload
+        if generation != self._figures_generation:
+            return
+        
+        self._loaded_figure_count += row_count
+        self._all_figures_loaded = row_count < self.FIGURES_PAGE_SIZE
+        self._figures_loading = False
+        
+        # Rows left over from before a refresh may have shifted; drop them so later pages refetch
+        if len(self._row_ids) > self._next_row_index:
+            del self._row_ids[self._next_row_index:]
+            del self._row_paths[self._next_row_index:]
+            del self._row_texts[self._next_row_index:]
+            del self._row_values[self._next_row_index:]
+            self._render_figures_window()
+    
+    def on_figures_scroll(self, first, last):
+        """Map the tree's view onto all loaded figures, shifting the window and paging as needed."""
+        first, last = float(first), float(last)
+        total = len(self._row_texts)
+        if not total:
+            self.figures_scrollbar.set(0.0, 1.0)
+            return
+        
+        window = min(total, self.FIGURES_WINDOW_ROWS)
+        top = self._view_start + first * window
+        bottom = self._view_start + last * window
+        self.figures_scrollbar.set(top / total, bottom / total)
+        
+        # Shift the window once the view nears either edge of the realized rows
+        start = self._view_start
+        if (first < 0.2 and start > 0) or (last > 0.8 and start + window < total):
+            self._view_start = int(top) - window // 4
+            self._render_figures_window()
+            self.figures_tree.yview_moveto((top - self._view_start) / window)
+        
+        if bottom / total > 0.9 and not self._all_figures_loaded:
+            try:
+                self.load_more_figures()
+            except Exception as e:
+                print(f"Error loading figures: {e}")
+    
+    def _load_filter_datasets(self):
+        """Fill the dataset filter with the known dataset names."""
+        try:
+            self.filter_dataset_combo['values'] = ("All",) + tuple(dataset.name for dataset in self._get_datasets())
+        except Exception as e:
+            print(f"Error loading datasets: {e}")
+    
     def apply_filters(self):
         """Apply filters to the figures list."""
-        # For now, just reload all figures
-        # In a full implementation, you would filter based on the filter criteria
+        # Filtering happens in SQL so only matching rows are fetched
+        dataset_name = self.filter_dataset_var.get()
+        figure_type = self.filter_type_var.get()
+        search_text = self.search_var.get().strip()
+        
+        filters = (
+            dataset_name if dataset_name and dataset_name != "All" else None,
+            figure_type if figure_type and figure_type != "All" else None,
+            f"%{search_text}%" if search_text else None
+        )
+        
+        # Unchanged filters over an up-to-date list would fetch the same rows again
+        if filters == self._figure_filters and not self._browse_dirty:
+            return
+        
+        self._figure_filters = filters
+        self.load_figures(force=True)
+    
+    def refresh_figures(self):
+        """Reload the figures list with the current filters, updating only rows that changed."""
         self.load_figures()
     
     def open_figure(self):
@@ -2788,23 +3682,25 @@ class FigureGenerationGUI:
             messagebox.showwarning("No Selection", "Please select a figure to open.")
             return
         
-        item = self.figures_tree.item(selection[0])
-        figure_path = item['values'][3]  # path column
+        figure_path = self._row_paths[int(selection[0])]
         
         try:
-            import subprocess
-            import platform
-            
-            if platform.system() == 'Windows':
-                os.startfile(figure_path)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.call(['open', figure_path])
-            else:  # Linux
-                subprocess.call(['xdg-open', figure_path])
+            self._opener(figure_path)
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open figure: {str(e)}")
     
+    @staticmethod
+    def _resolve_opener():
+        """Return a function that opens a file with the platform's default application."""
+        system = platform.system()
+        if system == 'Windows':
+            return os.startfile
+        elif system == 'Darwin':  # macOS
+            return lambda path: subprocess.Popen(['open', path])
+        else:  # Linux
+            return lambda path: subprocess.Popen(['xdg-open', path])
+    
     def copy_figure_path(self):
         """Copy figure path to clipboard."""
         selection = self.figures_tree.selection()
@@ -2812,12 +3708,23 @@ class FigureGenerationGUI:
             messagebox.showwarning("No Selection", "Please select a figure.")
             return
         
-        item = self.figures_tree.item(selection[0])
-        figure_path = item['values'][3]
+        figure_path = self._row_paths[int(selection[0])]
         
         self.window.clipboard_clear()
         self.window.clipboard_append(figure_path)
-        messagebox.showinfo("Copied", f"Path copied to clipboard:\\n{figure_path}")
+        self.show_status(f"Copied: {figure_path}")
+    
+    def show_status(self, message):
+        """Show a Browse tab status message and clear it after STATUS_CLEAR_MS."""
+        self.status_var.set(message)
+        if self._status_clear_after is not None:
+            self.window.after_cancel(self._status_clear_after)
+        self._status_clear_after = self.window.after(self.STATUS_CLEAR_MS, self._clear_status)
+    
+    def _clear_status(self):
+        """Clear the Browse tab status message."""
+        self._status_clear_after = None
+        self.status_var.set("")
     
     def delete_figure(self):
         """Delete selected figure."""
@@ -2857,14 +3764,14 @@ class FigureGenerationGUI:
             
             # Load raster matrix
             raster_file = self.file_selection_widgets['raster_matrix']['var'].get()
-            dataset_path = os.path.join("data", "datasets", self.selected_dataset.name)
+            dataset_path = self.get_dataset_path()
             raster_path = os.path.join(dataset_path, raster_file)
-            raster_matrix = np.load(raster_path)
+            raster_matrix = _load_matrix(raster_path)
             
             # Load annotation data
             annotation_file = self.file_selection_widgets['annotation']['var'].get()
             annotation_path = os.path.join(dataset_path, annotation_file)
-            annotation_df = pd.read_csv(annotation_path)
+            annotation_df = self._read_labels(annotation_path)
             annotation_data = annotation_df.iloc[:, 0].values
             
             # Get time window parameters
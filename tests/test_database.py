@@ -0,0 +1,67 @@
+import unittest
+import tempfile
+import os
+from src.database import connection
+from src.database.connection import get_database, close_database
+from src.database.operations import DatasetOperations
+
+
+class TestDatabase(unittest.TestCase):
+    def setUp(self):
+        self.temp_db = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+        self.temp_db.close()
+        # Point the global instance used by the operations classes at the temp database
+        close_database()
+        self.db = get_database(self.temp_db.name)
+
+    def tearDown(self):
+        close_database()
+        os.unlink(self.temp_db.name)
+        for suffix in ('-wal', '-shm'):
+            if os.path.exists(self.temp_db.name + suffix):
+                os.unlink(self.temp_db.name + suffix)
+
+    def test_database_creation(self):
+        """Test database creation."""
+        info = self.db.get_database_info()
+        self.assertIn('datasets', info['tables'])
+        self.assertIn('processing_jobs', info['tables'])
+        self.assertIn('figures', info['tables'])
+
+    def test_prepared_statement_round_trip(self):
+        """Test that a prepared query runs with fresh parameters on every call."""
+        self.db.prepare('dataset_names', "SELECT name FROM datasets WHERE name LIKE ? ORDER BY name")
+        self.assertEqual(self.db.execute_prepared('dataset_names', ('%',)), [])
+
+        for name in ("alpha", "beta", "alphabet"):
+            self.db.execute_insert("INSERT INTO datasets (name, file_path) VALUES (?, ?)", (name, "/tmp/x"))
+
+        self.assertEqual(self.db.execute_prepared('dataset_names', ('alpha%',)), [("alpha",), ("alphabet",)])
+        self.assertEqual(self.db.execute_prepared('dataset_names', ('b%',)), [("beta",)])
+
+    def test_prepared_statement_unknown_name(self):
+        """Test that executing an unregistered query name fails."""
+        with self.assertRaises(KeyError):
+            self.db.execute_prepared('missing')
+
+    def test_search_datasets_limit(self):
+        """Test that search_datasets caps results only when a limit is given."""
+        for index in range(5):
+            DatasetOperations.create_dataset(name=f"match_{index}", file_path="/test/path.csv")
+        DatasetOperations.create_dataset(name="other", file_path="/test/path.csv")
+
+        self.assertEqual(len(DatasetOperations.search_datasets("match")), 5)
+        self.assertEqual(len(DatasetOperations.search_datasets("match", limit=2)), 2)
+        self.assertEqual(len(DatasetOperations.search_datasets("match", limit=10)), 5)
+        self.assertEqual(len(DatasetOperations.search_datasets("match", limit=None)), 5)
+
+        limited = DatasetOperations.search_datasets("match", limit=3)
+        self.assertTrue(all(dataset.name.startswith("match_") for dataset in limited))
+
+    def test_global_instance(self):
+        """Test that get_database returns the temp database instance."""
+        self.assertIs(connection._db_instance, self.db)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import tempfile
+import threading
+import os
+import numpy as np
+from src.gui.figure_generation_gui import FigureGenerationGUI, _max_downsample, _npz_array_sizes
+
+
+class TestFigureHelpers(unittest.TestCase):
+    def test_max_downsample_keeps_events(self):
+        """Test that block-max reduction keeps isolated events."""
+        matrix = np.zeros((10, 10), dtype=np.uint8)
+        matrix[7, 3] = 1
+        reduced = _max_downsample(matrix, 5, 5)
+        self.assertEqual(reduced.shape, (5, 5))
+        self.assertEqual(reduced.sum(), 1)
+        self.assertEqual(reduced[3, 1], 1)
+
+    def test_max_downsample_small_matrix_unchanged(self):
+        """Test that matrices within the limits are returned as is."""
+        matrix = np.arange(6).reshape(2, 3)
+        self.assertIs(_max_downsample(matrix, 10, 10), matrix)
+
+    def test_npz_array_sizes(self):
+        """Test reading array sizes from .npz headers."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "arrays.npz")
+            np.savez(path, a=np.zeros((3, 4)), b=np.zeros(5))
+            self.assertEqual(_npz_array_sizes(path), {'a': 12, 'b': 5})
+
+            compressed_path = os.path.join(temp_dir, "compressed.npz")
+            np.savez_compressed(compressed_path, c=np.zeros((2, 2, 2)))
+            self.assertEqual(_npz_array_sizes(compressed_path), {'c': 8})
+
+
+class TestFileFiltering(unittest.TestCase):
+    def setUp(self):
+        self.gui = FigureGenerationGUI.__new__(FigureGenerationGUI)
+        self.gui._file_index_source = None
+        self.gui.available_files = [
+            "processed/matrices/Raster_matrix_a.npy",
+            "processed/matrices/column_labels.csv",
+            "processed/matrices/row_labels.csv",
+            "raw/Raster_matrix_b.npy",
+            "raw/notes.txt",
+        ]
+
+    def test_filter_by_extension_and_pattern(self):
+        """Test filtering the dataset file list by extension and glob pattern."""
+        self.assertEqual(self.gui.filter_files_by_type([".npy"], "Raster_matrix*"),
+                         ("processed/matrices/Raster_matrix_a.npy", "raw/Raster_matrix_b.npy"))
+        self.assertEqual(self.gui.filter_files_by_type([".csv"], "*row_labels*"),
+                         ("processed/matrices/row_labels.csv",))
+        self.assertEqual(self.gui.filter_files_by_type([".CSV", ".txt"]),
+                         ("processed/matrices/column_labels.csv", "processed/matrices/row_labels.csv",
+                          "raw/notes.txt"))
+
+    def test_index_follows_new_file_list(self):
+        """Test that memoized results are dropped when the file list is replaced."""
+        self.assertEqual(len(self.gui.filter_files_by_type([".npy"])), 2)
+        self.gui.available_files = ["raw/Raster_matrix_c.npy"]
+        self.assertEqual(self.gui.filter_files_by_type([".npy"]), ("raw/Raster_matrix_c.npy",))
+        self.gui.available_files = []
+        self.assertEqual(self.gui.filter_files_by_type([".npy"]), ())
+
+
+class TestLabelCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.gui = FigureGenerationGUI.__new__(FigureGenerationGUI)
+        self.gui._label_cache = {}
+        self.gui._label_lock = threading.Lock()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_labels(self, name, values, mtime):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, "w") as f:
+            f.write("row_labels\n" + "\n".join(str(value) for value in values) + "\n")
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_rewritten_file_is_reread(self):
+        """Test that a cached frame is reused until the file's mtime changes."""
+        path = self.write_labels("row_labels.csv", [1, 2, 3], 1000)
+        first = self.gui._read_labels(path)
+        self.assertIs(self.gui._read_labels(path), first)
+
+        self.write_labels("row_labels.csv", [4, 5], 2000)
+        second = self.gui._read_labels(path)
+        self.assertIsNot(second, first)
+        self.assertEqual(second['row_labels'].tolist(), [4, 5])
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that a full cache evicts the entry used least recently."""
+        self.gui.LABEL_CACHE_SIZE = 2
+        paths = [self.write_labels(f"labels_{index}.csv", [index], 1000) for index in range(3)]
+        first = self.gui._read_labels(paths[0])
+        self.gui._read_labels(paths[1])
+
+        # Using the first file again makes the second one the eviction candidate
+        self.gui._read_labels(paths[0])
+        self.gui._read_labels(paths[2])
+
+        self.assertEqual(list(self.gui._label_cache), [paths[0], paths[2]])
+        self.assertIs(self.gui._read_labels(paths[0]), first)
+
+
+if __name__ == '__main__':
+    unittest.main()